@@ -13,6 +13,9 @@ from datetime import datetime, timedelta
 FINANCIAL_GUARDIAN_URL = "http://localhost:8081"  # Change if deployed differently
 DEMO_ACCOUNT = "alice_demo_123"
 
+# One keep-alive connection reused across every demo call
+SESSION = requests.Session()
+
 def print_banner(title):
     """Print a nice banner for demo sections"""
     print("\n" + "="*60)
@@ -29,7 +32,7 @@ def check_service_health():
     print_banner("🏥 HEALTH CHECK")
     
     try:
-        response = requests.get(f"{FINANCIAL_GUARDIAN_URL}/ready", timeout=5)
+        response = SESSION.get(f"{FINANCIAL_GUARDIAN_URL}/ready", timeout=5)
         if response.status_code == 200:
             print("✅ Financial Guardian is READY!")
             print_response(response.json())
@@ -37,7 +40,7 @@ def check_service_health():
             print("❌ Service not ready")
             return False
             
-        response = requests.get(f"{FINANCIAL_GUARDIAN_URL}/healthy", timeout=5)
+        response = SESSION.get(f"{FINANCIAL_GUARDIAN_URL}/healthy", timeout=5)
         if response.status_code == 200:
             print("✅ Financial Guardian is HEALTHY!")
             print_response(response.json())
@@ -59,7 +62,7 @@ def start_monitoring():
     payload = {"account_id": DEMO_ACCOUNT}
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{FINANCIAL_GUARDIAN_URL}/monitor/start",
             json=payload,
             timeout=10
@@ -96,8 +99,8 @@ def demo_normal_transaction():
     print(f"   Time: {transaction['timestamp']}")
     
     try:
-        response = requests.post(
-            f"{FINANCIAL_GUARDIAN_URL}/fraud/check",
+        response = SESSION.post(
+            f"{FINANCIAL_GUARDIAN_URL}/fraud/check?wait=1",
             json=transaction,
             timeout=15
         )
@@ -149,8 +152,8 @@ def demo_suspicious_transaction():
     print(f"   Time: {transaction['timestamp']} 🌙")
     
     try:
-        response = requests.post(
-            f"{FINANCIAL_GUARDIAN_URL}/fraud/check",
+        response = SESSION.post(
+            f"{FINANCIAL_GUARDIAN_URL}/fraud/check?wait=1",
             json=transaction,
             timeout=15
         )
@@ -209,8 +212,8 @@ def demo_fraud_transaction():
     print(f"   Time: {transaction['timestamp']} 🌃")
     
     try:
-        response = requests.post(
-            f"{FINANCIAL_GUARDIAN_URL}/fraud/check",
+        response = SESSION.post(
+            f"{FINANCIAL_GUARDIAN_URL}/fraud/check?wait=1",
             json=transaction,
             timeout=15
         )
@@ -251,7 +254,7 @@ def check_fraud_alerts():
     print_banner("📋 FRAUD ALERTS CHECK")
     
     try:
-        response = requests.get(
+        response = SESSION.get(
             f"{FINANCIAL_GUARDIAN_URL}/fraud/alerts",
             params={"account_id": DEMO_ACCOUNT},
             timeout=10
@@ -289,7 +292,7 @@ def stop_monitoring():
     payload = {"account_id": DEMO_ACCOUNT}
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{FINANCIAL_GUARDIAN_URL}/monitor/stop",
             json=payload,
             timeout=10
@@ -9,17 +9,32 @@ to detect fraudulent patterns and automatically block suspicious transactions.
 
 import os
 import logging
-import json
+import asyncio
+import hashlib
+import heapq
 import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from datetime import datetime
+from typing import Dict, Hashable, List, Optional, Any, Tuple
+from uuid import uuid4
 from threading import Thread, Lock
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from collections import Counter, OrderedDict, deque
+from dataclasses import dataclass, field
+import queue
 import signal
 import sys
+from functools import lru_cache, partial
+from itertools import islice
 
 from flask import Flask, request, jsonify, Response
+from flask.json.provider import JSONProvider
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import jwt
+import numpy as np
+import orjson
 import google.generativeai as genai
 import structlog
 
@@ -44,6 +59,312 @@ structlog.configure(
 
 logger = structlog.get_logger()
 
+# Outbound HTTP: (connect, read) timeouts and connection pool sizing
+HTTP_TIMEOUT = (1, 5)
+HTTP_POOL_CONNECTIONS = int(os.getenv('HTTP_POOL_CONNECTIONS', '32'))
+HTTP_POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', '64'))
+
+# Monitor loop: accounts fetched concurrently per cycle and seconds between cycles
+MONITOR_CONCURRENCY = int(os.getenv('MONITOR_CONCURRENCY', '32'))
+MONITOR_INTERVAL_SECONDS = 5
+
+# Pull loop over monitored accounts; disable once transactions are pushed to /fraud/ingest
+ENABLE_POLLING = os.getenv('ENABLE_POLLING', '1') == '1'
+
+# Fraud-check micro-batching: transactions per Gemini prompt and max wait to fill a batch
+FRAUD_BATCH_MAX_SIZE = int(os.getenv('FRAUD_BATCH_MAX_SIZE', '8'))
+FRAUD_BATCH_MAX_WAIT_MS = int(os.getenv('FRAUD_BATCH_MAX_WAIT_MS', '200'))
+FRAUD_BATCH_WORKERS = 4
+FRAUD_RESULT_TIMEOUT_SECONDS = 10
+
+# AI verdict cache: the monitor loop re-sees the same transactions every cycle
+ANALYSIS_CACHE_SIZE = int(os.getenv('ANALYSIS_CACHE_SIZE', '50000'))
+ANALYSIS_CACHE_TTL_SECONDS = int(os.getenv('ANALYSIS_CACHE_TTL_SECONDS', '600'))
+
+# /fraud/check jobs: results kept for polling, and how long ?wait=1 blocks
+CHECK_RESULT_CACHE_SIZE = 100000
+CHECK_RESULT_TTL_SECONDS = 300
+CHECK_WAIT_SECONDS = 15
+
+# Per-account profile arrays grow in blocks and keep at most this many transactions
+PROFILE_BLOCK_SIZE = 128
+PROFILE_MAX_TRANSACTIONS = 10000
+RECENT_WINDOW_SECONDS = 24 * 3600
+
+# Transaction ids remembered per profile to skip duplicates; evicted ones are judged by timestamp
+PROFILE_SEEN_IDS = 1000
+
+# Parsed transaction timestamps remembered, so each distinct timestamp is parsed once
+TIMESTAMP_CACHE_SIZE = 65536
+
+# Accounts with a profile; the least recently used one is dropped past this many
+PROFILE_CACHE_SIZE = int(os.getenv('PROFILE_CACHE_SIZE', '10000'))
+
+# Raw transactions kept per profile, and how long /fraud/check trusts them over a fresh fetch
+PROFILE_HISTORY_SIZE = 200
+HISTORY_CACHE_MAX_AGE_SECONDS = 10
+
+# Prompts carry a statistical history summary plus only the newest raw transactions
+PROMPT_RECENT_TRANSACTIONS = 5
+PROMPT_TOP_COUNTERPARTIES = 5
+
+# Alerts kept per account; older alerts are dropped as new ones arrive
+MAX_ALERTS_PER_ACCOUNT = 1000
+ALERT_LOCK_STRIPES = 64  # power of two so the stripe is picked with a mask
+
+# Prompt templates are constant; each call only fills the %s slots with serialized payloads
+FRAUD_PROMPT_TEMPLATE = """\
+Analyze this banking transaction for fraud indicators:
+
+Current Transaction: %s
+
+User Transaction History Summary (last 30 days):
+%s
+
+Most Recent Transactions:
+%s
+
+Context Analysis:
+%s
+
+Please analyze for fraud indicators and respond with JSON:
+{
+    "fraud_score": <float 0-1>,
+    "risk_level": "<LOW|MEDIUM|HIGH|CRITICAL>",
+    "explanation": "<detailed explanation>",
+    "red_flags": [<list of specific concerns>],
+    "recommendation": "<ALLOW|FLAG|BLOCK>"
+}
+
+Consider factors like:
+- Amount vs typical spending patterns
+- Time of day vs normal activity
+- Frequency of recent transactions
+- Geographic/routing number anomalies
+- Sudden behavior changes
+"""
+
+BATCH_FRAUD_PROMPT_TEMPLATE = """\
+Analyze each of these banking transactions for fraud indicators.
+
+Transactions (each references its user's history by history_index):
+%s
+
+User Transaction Histories (last 30 days summary plus most recent transactions):
+%s
+
+Respond with a JSON array containing exactly one object per transaction, in the same order:
+[
+    {
+        "index": <transaction index>,
+        "fraud_score": <float 0-1>,
+        "risk_level": "<LOW|MEDIUM|HIGH|CRITICAL>",
+        "explanation": "<detailed explanation>",
+        "red_flags": [<list of specific concerns>],
+        "recommendation": "<ALLOW|FLAG|BLOCK>"
+    }
+]
+
+Consider factors like:
+- Amount vs typical spending patterns
+- Time of day vs normal activity
+- Frequency of recent transactions
+- Geographic/routing number anomalies
+- Sudden behavior changes
+"""
+
+def dumps_indented(obj: Any) -> str:
+    """Pretty-print a payload for embedding in a Gemini prompt"""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson for request parsing and responses"""
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+def create_http_session(pool_maxsize: int = HTTP_POOL_MAXSIZE) -> requests.Session:
+    """Create a pooled, keep-alive session with retries on transient upstream errors"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504])
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def strip_markdown_json(text: str) -> str:
+    """Extract the JSON payload from a model response that may be markdown-wrapped"""
+    response_text = text.strip()
+    
+    # Strip markdown code blocks if present - handle various formats
+    if '```json' in response_text:
+        # Extract content between ```json and ```
+        start_marker = '```json'
+        end_marker = '```'
+        start_idx = response_text.find(start_marker)
+        if start_idx != -1:
+            start_idx += len(start_marker)
+            # Skip the newline after ```json
+            if start_idx < len(response_text) and response_text[start_idx] == '\n':
+                start_idx += 1
+            end_idx = response_text.find(end_marker, start_idx)
+            # An unterminated block (e.g. a partial stream) runs to the end of the text
+            response_text = response_text[start_idx:end_idx] if end_idx != -1 else response_text[start_idx:]
+    elif '```' in response_text:
+        # Handle generic code blocks
+        start_marker = '```'
+        end_marker = '```'
+        start_idx = response_text.find(start_marker)
+        if start_idx != -1:
+            start_idx += len(start_marker)
+            # Skip any language identifier on the same line
+            newline_idx = response_text.find('\n', start_idx)
+            if newline_idx != -1:
+                start_idx = newline_idx + 1
+            end_idx = response_text.find(end_marker, start_idx)
+            response_text = response_text[start_idx:end_idx] if end_idx != -1 else response_text[start_idx:]
+    
+    # Clean up any remaining formatting
+    return response_text.strip()
+
+# One Gemini client per process, shared by every detector and thread. The SDK caches the
+# underlying service client, so pinning the transport keeps a single long-lived gRPC
+# (HTTP/2) channel open for the pod's lifetime instead of reconnecting per request.
+GEMINI_TRANSPORT = os.getenv('GEMINI_TRANSPORT', 'grpc')
+_model = None
+_model_lock = Lock()
+
+def get_gemini_model(api_key: str, model_name: str) -> genai.GenerativeModel:
+    """Configure Gemini and build the process-wide GenerativeModel on first use"""
+    global _model
+    with _model_lock:
+        if _model is None:
+            genai.configure(api_key=api_key, transport=GEMINI_TRANSPORT)
+            _model = genai.GenerativeModel(model_name)
+        return _model
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def parse_timestamp(timestamp: str) -> Tuple[Optional[int], Optional[int]]:
+    """Epoch seconds and hour of an ISO timestamp, or (None, None) if malformed"""
+    # Skip values that can't be a full YYYY-MM-DDTHH:MM:SS timestamp without raising
+    if len(timestamp) < 19:
+        return None, None
+    try:
+        tx_time = datetime.fromisoformat(timestamp)
+    except ValueError:
+        return None, None
+    return int(tx_time.timestamp()), tx_time.hour
+
+class AnalysisCache:
+    """Thread-safe LRU cache whose entries expire after ttl seconds"""
+    
+    def __init__(self, maxsize: int = ANALYSIS_CACHE_SIZE, ttl: int = ANALYSIS_CACHE_TTL_SECONDS):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries = OrderedDict()  # key -> (expires_at, value)
+        self.lock = Lock()
+    
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return entry[1]
+    
+    def put(self, key: Hashable, value: Dict[str, Any]):
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.ttl, value)
+            self.entries.move_to_end(key)
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+def transaction_key(transaction: Dict) -> Hashable:
+    """Identity of a transaction: its uuid, or its defining fields when it has none"""
+    return transaction.get('uuid') or (
+        transaction.get('timestamp'), transaction.get('fromAccountNum'),
+        transaction.get('toAccountNum'), transaction.get('amount'),
+    )
+
+def timestamp_text(transaction: Dict) -> str:
+    """A transaction's timestamp for ordering; '' when missing, null or not a string"""
+    timestamp = transaction.get('timestamp')
+    return timestamp if isinstance(timestamp, str) else ''
+
+def recent_transactions(history: List[Dict], n: int = PROMPT_RECENT_TRANSACTIONS) -> List[Dict]:
+    """The n latest transactions by timestamp, oldest first, whatever order the history is in
+    
+    transactionhistory lists newest first while cached profiles are oldest first.
+    """
+    return heapq.nlargest(n, history, key=timestamp_text)[::-1]
+
+class SeenTransactions:
+    """Bounded set of transactions already handled, deduplicated by id rather than timestamp order"""
+    
+    def __init__(self, maxsize: int = PROFILE_SEEN_IDS):
+        self.maxsize = maxsize
+        self.ids = OrderedDict()  # transaction key -> timestamp, oldest first
+        self.floor = ''  # newest timestamp evicted; anything older counts as seen
+    
+    def unseen(self, transactions: List[Dict]) -> List[Dict]:
+        """The given transactions not handled yet, oldest first, without duplicates"""
+        new = {}
+        for t in transactions:
+            key = transaction_key(t)
+            if key not in self.ids and timestamp_text(t) >= self.floor:
+                new.setdefault(key, t)
+        return sorted(new.values(), key=timestamp_text)
+    
+    def add(self, transactions: List[Dict]):
+        for t in transactions:
+            self.ids[transaction_key(t)] = timestamp_text(t)
+        while len(self.ids) > self.maxsize:
+            _, timestamp = self.ids.popitem(last=False)
+            self.floor = max(self.floor, timestamp)
+
+@dataclass
+class UserProfile:
+    """Observed transaction amounts and epoch timestamps for one account, oldest first"""
+    amounts: np.ndarray = field(default_factory=lambda: np.empty(PROFILE_BLOCK_SIZE))
+    timestamps: np.ndarray = field(default_factory=lambda: np.empty(PROFILE_BLOCK_SIZE))
+    size: int = 0
+    observed: SeenTransactions = field(default_factory=SeenTransactions)  # folded into the arrays
+    analyzed: SeenTransactions = field(default_factory=SeenTransactions)  # checked by the monitor
+    history: deque = field(default_factory=lambda: deque(maxlen=PROFILE_HISTORY_SIZE))
+    updated_at: float = 0.0  # monotonic time the history was last observed
+    
+    def extend(self, amounts: np.ndarray, timestamps: np.ndarray):
+        """Append transactions, growing in blocks and dropping the oldest past the cap"""
+        amounts = amounts[-PROFILE_MAX_TRANSACTIONS:]
+        timestamps = timestamps[-PROFILE_MAX_TRANSACTIONS:]
+        keep = min(self.size, PROFILE_MAX_TRANSACTIONS - len(amounts))
+        if keep < self.size:
+            self.amounts[:keep] = self.amounts[self.size - keep:self.size]
+            self.timestamps[:keep] = self.timestamps[self.size - keep:self.size]
+            self.size = keep
+        
+        needed = self.size + len(amounts)
+        if needed > len(self.amounts):
+            capacity = -(-needed // PROFILE_BLOCK_SIZE) * PROFILE_BLOCK_SIZE
+            self.amounts = np.resize(self.amounts, capacity)
+            self.timestamps = np.resize(self.timestamps, capacity)
+        self.amounts[self.size:needed] = amounts
+        self.timestamps[self.size:needed] = timestamps
+        self.size = needed
+    
+    def view(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Filled portion of the amount and timestamp arrays"""
+        return self.amounts[:self.size], self.timestamps[:self.size]
+
 class FraudDetector:
     """AI-powered fraud detection using Google Gemini"""
     
@@ -51,28 +372,30 @@ class FraudDetector:
         self.api_key = api_key
         self.model_name = model
         self.model = None
-        self.user_profiles = {}  # Cache for user transaction patterns
+        self.user_profiles: OrderedDict[str, UserProfile] = OrderedDict()  # account_id -> running stats, LRU first
         self.profile_lock = Lock()
+        self.analysis_cache = AnalysisCache()
         self.ai_available = False
         
         # Initialize AI lazily to avoid startup timeouts
         if api_key and api_key != "dummy":
             try:
-                genai.configure(api_key=api_key)
-                self.model = genai.GenerativeModel(model)
+                self.model = get_gemini_model(api_key, model)
                 self.ai_available = True
                 logger.info("Gemini AI configured successfully")
             except Exception as e:
                 logger.warning("Gemini AI initialization failed, using fallback mode", error=str(e))
                 self.ai_available = False
         
-    def analyze_transaction(self, transaction: Dict, user_history: List[Dict]) -> Dict[str, Any]:
+    def analyze_transaction(self, transaction: Dict, user_history: List[Dict],
+                            account_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Analyze a transaction for fraud indicators using AI
         
         Args:
             transaction: Current transaction to analyze
             user_history: List of user's previous transactions
+            account_id: Account whose observed profile supplies the statistics, if any
             
         Returns:
             Dict with fraud_score, risk_level, and explanation
@@ -80,129 +403,263 @@ class FraudDetector:
         # Use AI if available, otherwise use fallback
         if not self.ai_available or not self.model:
             logger.info("Using fallback analysis (AI not available)")
-            return self._fallback_analysis(transaction, user_history)
+            return self._fallback_analysis(transaction, user_history, account_id)
         
         try:
             # Build context for AI analysis
-            context = self._build_analysis_context(transaction, user_history)
-            
-            prompt = f"""
-            Analyze this banking transaction for fraud indicators:
-            
-            Current Transaction: {json.dumps(transaction, indent=2)}
-            
-            User Transaction History (last 30 days):
-            {json.dumps(user_history[-50:], indent=2)}  # Last 50 transactions
-            
-            Context Analysis:
-            {json.dumps(context, indent=2)}
-            
-            Please analyze for fraud indicators and respond with JSON:
-            {{
-                "fraud_score": <float 0-1>,
-                "risk_level": "<LOW|MEDIUM|HIGH|CRITICAL>",
-                "explanation": "<detailed explanation>",
-                "red_flags": [<list of specific concerns>],
-                "recommendation": "<ALLOW|FLAG|BLOCK>"
-            }}
+            context = self._build_analysis_context(transaction, user_history, account_id)
+            cache_key = self._cache_key(transaction, context)
+            cached = self.analysis_cache.get(cache_key)
+            if cached is not None:
+                return cached
             
-            Consider factors like:
-            - Amount vs typical spending patterns
-            - Time of day vs normal activity
-            - Frequency of recent transactions
-            - Geographic/routing number anomalies
-            - Sudden behavior changes
-            """
-            
-            response = self.model.generate_content(prompt)
+            prompt = FRAUD_PROMPT_TEMPLATE % (
+                dumps_indented(transaction),
+                dumps_indented(self._summarize_history(user_history, account_id)),
+                dumps_indented(recent_transactions(user_history)),
+                dumps_indented(context),
+            )
             
             # Parse AI response - handle markdown-wrapped JSON
             try:
-                response_text = response.text.strip()
-                
-                # Strip markdown code blocks if present - handle various formats
-                if '```json' in response_text:
-                    # Extract content between ```json and ```
-                    start_marker = '```json'
-                    end_marker = '```'
-                    start_idx = response_text.find(start_marker)
-                    if start_idx != -1:
-                        start_idx += len(start_marker)
-                        # Skip the newline after ```json
-                        if start_idx < len(response_text) and response_text[start_idx] == '\n':
-                            start_idx += 1
-                        end_idx = response_text.find(end_marker, start_idx)
-                        if end_idx != -1:
-                            response_text = response_text[start_idx:end_idx]
-                elif '```' in response_text:
-                    # Handle generic code blocks
-                    start_marker = '```'
-                    end_marker = '```'
-                    start_idx = response_text.find(start_marker)
-                    if start_idx != -1:
-                        start_idx += len(start_marker)
-                        # Skip any language identifier on the same line
-                        newline_idx = response_text.find('\n', start_idx)
-                        if newline_idx != -1:
-                            start_idx = newline_idx + 1
-                        end_idx = response_text.find(end_marker, start_idx)
-                        if end_idx != -1:
-                            response_text = response_text[start_idx:end_idx]
-                
-                # Clean up any remaining formatting
-                response_text = response_text.strip()
-                
-                result = json.loads(response_text)
+                result = self._generate_json(prompt)
                 logger.info("AI fraud analysis completed", 
                            transaction_id=transaction.get('uuid', 'unknown'),
                            fraud_score=result.get('fraud_score', 0),
                            risk_level=result.get('risk_level', 'UNKNOWN'))
+                self.analysis_cache.put(cache_key, result)
                 return result
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.warning("AI response not valid JSON, using fallback", 
-                              response=response.text,
+                              response=e.doc,
                               error=str(e))
-                return self._fallback_analysis(transaction, user_history)
+                return self._fallback_analysis(transaction, user_history, account_id)
                 
         except Exception as e:
             logger.error("Error in AI fraud analysis, using fallback", error=str(e))
-            return self._fallback_analysis(transaction, user_history)
+            return self._fallback_analysis(transaction, user_history, account_id)
     
-    def _build_analysis_context(self, transaction: Dict, history: List[Dict]) -> Dict:
-        """Build statistical context for AI analysis"""
-        if not history:
-            return {"profile_available": False}
+    def analyze_batch(self, items: List[Tuple[Dict, List[Dict], Optional[str]]]) -> List[Dict[str, Any]]:
+        """
+        Analyze several transactions with a single Gemini request
+        
+        Args:
+            items: (transaction, user_history, account_id) triples; items may share a history list
             
-        amounts = [t.get('amount', 0) for t in history]
+        Returns:
+            One analysis dict per item, in the same order
+        """
+        if len(items) == 1:
+            return [self.analyze_transaction(*items[0])]
+        
+        if not self.ai_available or not self.model:
+            logger.info("Using fallback analysis (AI not available)", batch_size=len(items))
+            return [self._fallback_analysis(transaction, history, account_id) for transaction, history, account_id in items]
+        
+        # Monitor-loop batches usually share one history per account, so send each once
+        histories = []
+        history_index = {}
+        entries = []
+        for i, (transaction, history, account_id) in enumerate(items):
+            if id(history) not in history_index:
+                history_index[id(history)] = len(histories)
+                histories.append({
+                    "summary": self._summarize_history(history, account_id),
+                    "recent": recent_transactions(history),
+                })
+            entries.append({
+                "index": i,
+                "transaction": transaction,
+                "history_index": history_index[id(history)],
+                "context": self._build_analysis_context(transaction, history, account_id),
+            })
+        
+        prompt = BATCH_FRAUD_PROMPT_TEMPLATE % (dumps_indented(entries), dumps_indented(histories))
         
-        return {
-            "profile_available": True,
-            "avg_transaction_amount": sum(amounts) / len(amounts) if amounts else 0,
-            "max_transaction_amount": max(amounts) if amounts else 0,
-            "transaction_count_30d": len(history),
-            "current_amount_vs_avg": transaction.get('amount', 0) / (sum(amounts) / len(amounts)) if amounts and sum(amounts) > 0 else 1,
-            "recent_activity_count": len([t for t in history if self._is_recent(t, hours=24)]),
-            "unusual_time": self._is_unusual_time(transaction),
-        }
-    
-    def _is_recent(self, transaction: Dict, hours: int = 24) -> bool:
-        """Check if transaction is within recent timeframe"""
         try:
-            tx_time = datetime.fromisoformat(transaction.get('timestamp', ''))
-            return datetime.now() - tx_time < timedelta(hours=hours)
-        except:
-            return False
+            results = self._generate_json(prompt)
+            # Every index exactly once, or a verdict could land on (and be cached for) the wrong transaction
+            if (not isinstance(results, list) or not all(isinstance(r, dict) for r in results)
+                    or sorted(r.get('index', -1) for r in results) != list(range(len(items)))):
+                raise ValueError(f"expected one verdict for each of the {len(items)} indices")
+            
+            results.sort(key=lambda r: r['index'])
+            for entry, result in zip(entries, results):
+                result.pop('index', None)
+                self.analysis_cache.put(self._cache_key(entry['transaction'], entry['context']), result)
+            logger.info("AI batch fraud analysis completed", batch_size=len(items))
+            return results
+        except Exception as e:
+            logger.error("Error in AI batch fraud analysis, using fallback",
+                        batch_size=len(items), error=str(e))
+            return [self._fallback_analysis(transaction, history, account_id) for transaction, history, account_id in items]
+    
+    def _generate_json(self, prompt: str) -> Any:
+        """Stream a Gemini response and parse its JSON payload as soon as it is complete"""
+        chunks = []
+        for chunk in self.model.generate_content(prompt, stream=True):
+            chunks.append(chunk.text)
+            # A closing bracket may end the payload; stop reading once it parses
+            if '}' in chunks[-1] or ']' in chunks[-1]:
+                try:
+                    return orjson.loads(strip_markdown_json(''.join(chunks)))
+                except orjson.JSONDecodeError:
+                    continue
+        return orjson.loads(strip_markdown_json(''.join(chunks)))
+    
+    def cached_analysis(self, transaction: Dict, history: List[Dict],
+                        account_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Return a still-valid AI verdict for this transaction and history, if any"""
+        if not self.ai_available:
+            return None
+        context = self._build_analysis_context(transaction, history, account_id)
+        return self.analysis_cache.get(self._cache_key(transaction, context))
+    
+    def _cache_key(self, transaction: Dict, context: Dict) -> bytes:
+        """Stable key over the transaction identity and a coarse digest of its context"""
+        features = (
+            transaction.get('uuid'), transaction.get('amount'),
+            transaction.get('fromAccountNum'), transaction.get('toAccountNum'),
+            transaction.get('timestamp'),
+            round(context.get('avg_transaction_amount', 0)),
+            # New history for the account moves the bucket and invalidates the entry
+            context.get('transaction_count_30d', 0) // 10,
+            context.get('unusual_time', False),
+        )
+        return hashlib.blake2b(repr(features).encode(), digest_size=16).digest()
+    
+    def _profile(self, account_id: str) -> UserProfile:
+        """The account's profile, created on first use; call with profile_lock held"""
+        profile = self.user_profiles.get(account_id)
+        if profile is None:
+            profile = self.user_profiles[account_id] = UserProfile()
+            # Accounts only ever seen through /fraud/check must not accumulate forever
+            if len(self.user_profiles) > PROFILE_CACHE_SIZE:
+                self.user_profiles.popitem(last=False)
+        else:
+            self.user_profiles.move_to_end(account_id)
+        return profile
+    
+    def forget_profile(self, account_id: str):
+        """Drop an account's profile, e.g. when it is no longer monitored"""
+        with self.profile_lock:
+            self.user_profiles.pop(account_id, None)
+    
+    def observe_history(self, account_id: str, history: List[Dict]) -> List[Dict]:
+        """Fold transactions not seen before into the account's profile; returns them oldest first"""
+        with self.profile_lock:
+            profile = self._profile(account_id)
+            profile.updated_at = time.monotonic()
+            new = profile.observed.unseen(history)
+            if not new:
+                return []
+            
+            amounts, timestamps = self._history_arrays(new)
+            profile.extend(amounts, timestamps)
+            profile.history.extend(new)
+            profile.observed.add(new)
+            return new
+    
+    def claim_unanalyzed(self, account_id: str, history: List[Dict]) -> List[Dict]:
+        """Transactions the monitor has not analyzed yet, oldest first, marked as analyzed
+        
+        Tracked apart from observe_history, so history folded in by /fraud/check or
+        ingest seeding is still analyzed by the monitor.
+        """
+        with self.profile_lock:
+            analyzed = self._profile(account_id).analyzed
+            new = analyzed.unseen(history)
+            analyzed.add(new)
+            return new
+    
+    def cached_history(self, account_id: str,
+                       max_age: float = HISTORY_CACHE_MAX_AGE_SECONDS) -> Optional[List[Dict]]:
+        """Recently observed history for an account, oldest first, or None if stale or unknown"""
+        with self.profile_lock:
+            profile = self.user_profiles.get(account_id)
+            if profile is None or time.monotonic() - profile.updated_at > max_age:
+                return None
+            self.user_profiles.move_to_end(account_id)
+            return list(profile.history)
+    
+    def _history_arrays(self, history: List[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+        """Amounts and epoch timestamps of a history as float arrays"""
+        n = len(history)
+        amounts = np.fromiter((t.get('amount', 0) for t in history), dtype=float, count=n)
+        timestamps = np.fromiter(
+            (ts if (ts := self.transaction_time(t)[0]) is not None else np.nan for t in history),
+            dtype=float, count=n
+        )
+        return amounts, timestamps
+    
+    def _amounts_and_timestamps(self, history: List[Dict],
+                                account_id: Optional[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Prefer the account's observed profile; otherwise vectorize the given history"""
+        profile = self.user_profiles.get(account_id) if account_id else None
+        if profile is not None and profile.size:
+            return profile.view()
+        return self._history_arrays(history)
+    
+    def _summarize_history(self, history: List[Dict], account_id: Optional[str] = None) -> Dict:
+        """Compact numerical summary of a history, sent to Gemini instead of the raw records"""
+        with self.profile_lock:
+            amounts, timestamps = self._amounts_and_timestamps(history, account_id)
+            if not len(amounts):
+                return {"count": 0}
+            p50, p95 = np.percentile(amounts, [50, 95])
+            summary = {
+                "count": len(amounts),
+                "mean": round(float(amounts.mean()), 2),
+                "stddev": round(float(amounts.std()), 2),
+                "p50": float(p50),
+                "p95": float(p95),
+                "max": float(amounts.max()),
+                "recent_24h": int((timestamps > time.time() - RECENT_WINDOW_SECONDS).sum()),
+            }
+        
+        counterparties = Counter(
+            t.get('toAccountNum') if t.get('fromAccountNum') == account_id else t.get('fromAccountNum')
+            for t in history
+        )
+        summary["top_counterparties"] = counterparties.most_common(PROMPT_TOP_COUNTERPARTIES)
+        return summary
+    
+    def _build_analysis_context(self, transaction: Dict, history: List[Dict],
+                                account_id: Optional[str] = None) -> Dict:
+        """Build statistical context for AI analysis"""
+        with self.profile_lock:
+            amounts, timestamps = self._amounts_and_timestamps(history, account_id)
+            if not len(amounts):
+                return {"profile_available": False}
+            
+            avg = float(amounts.mean())
+            return {
+                "profile_available": True,
+                "avg_transaction_amount": avg,
+                "max_transaction_amount": float(amounts.max()),
+                "transaction_count_30d": len(amounts),
+                "current_amount_vs_avg": transaction.get('amount', 0) / avg if avg > 0 else 1,
+                "recent_activity_count": int((timestamps > time.time() - RECENT_WINDOW_SECONDS).sum()),
+                "unusual_time": self._is_unusual_time(transaction),
+            }
+    
+    def transaction_time(self, transaction: Dict) -> Tuple[Optional[int], Optional[int]]:
+        """Epoch seconds and hour of a transaction's timestamp, parsed once per distinct value
+        
+        The transaction dict itself is left untouched: it is sent to Gemini and returned to clients as is.
+        """
+        timestamp = transaction.get('timestamp')
+        if not isinstance(timestamp, str):
+            return None, None
+        return parse_timestamp(timestamp)
     
     def _is_unusual_time(self, transaction: Dict) -> bool:
         """Check if transaction is at an unusual time (late night/early morning)"""
-        try:
-            tx_time = datetime.fromisoformat(transaction.get('timestamp', ''))
-            hour = tx_time.hour
-            return hour < 6 or hour > 23  # 11 PM to 6 AM
-        except:
-            return False
+        hour = self.transaction_time(transaction)[1]
+        return hour is not None and (hour < 6 or hour > 23)  # 11 PM to 6 AM
     
-    def _fallback_analysis(self, transaction: Dict, history: List[Dict]) -> Dict:
+    def _fallback_analysis(self, transaction: Dict, history: List[Dict],
+                           account_id: Optional[str] = None) -> Dict:
         """Fallback rule-based analysis when AI fails"""
         amount = transaction.get('amount', 0)
         
@@ -210,8 +667,10 @@ class FraudDetector:
         fraud_score = 0.0
         red_flags = []
         
-        if history:
-            avg_amount = sum(t.get('amount', 0) for t in history) / len(history)
+        with self.profile_lock:
+            amounts, _ = self._amounts_and_timestamps(history, account_id)
+            avg_amount = float(amounts.mean()) if len(amounts) else 0
+        if avg_amount > 0:
             if amount > avg_amount * 10:  # 10x normal amount
                 fraud_score += 0.7
                 red_flags.append(f"Transaction amount ${amount/100:.2f} is {amount/avg_amount:.1f}x larger than average")
@@ -337,14 +796,73 @@ class FraudDetector:
                 "user_friendly": True
             }
 
+class BatchingFraudDetector:
+    """Micro-batches fraud checks so concurrent callers share Gemini requests"""
+    
+    def __init__(self, detector: FraudDetector, max_batch: int = FRAUD_BATCH_MAX_SIZE,
+                 max_wait_ms: int = FRAUD_BATCH_MAX_WAIT_MS):
+        self.detector = detector
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.pending = queue.Queue()
+        self.executor = ThreadPoolExecutor(max_workers=FRAUD_BATCH_WORKERS,
+                                           thread_name_prefix='fraud-batch')
+        self.collector_thread = Thread(target=self._collect, daemon=True)
+        self.collector_thread.start()
+    
+    def submit(self, transaction: Dict, history: List[Dict], account_id: Optional[str] = None) -> Future:
+        """Queue a transaction for analysis; the Future resolves to its analysis dict"""
+        future = Future()
+        cached = self.detector.cached_analysis(transaction, history, account_id)
+        if cached is not None:
+            future.set_result(cached)
+        else:
+            self.pending.put((transaction, history, account_id, future))
+        return future
+    
+    def analyze_transaction(self, transaction: Dict, history: List[Dict], account_id: Optional[str] = None,
+                            timeout: float = FRAUD_RESULT_TIMEOUT_SECONDS) -> Dict[str, Any]:
+        """Blocking analysis through the shared batch queue"""
+        return self.submit(transaction, history, account_id).result(timeout=timeout)
+    
+    def _collect(self):
+        """Gather up to max_batch items or max_wait seconds, whichever comes first"""
+        while True:
+            batch = [self.pending.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.pending.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self.executor.submit(self._run_batch, batch)
+    
+    def _run_batch(self, batch: List[Tuple[Dict, List[Dict], Optional[str], Future]]):
+        """Analyze one batch and resolve every caller's Future"""
+        try:
+            results = self.detector.analyze_batch([item[:3] for item in batch])
+            for item, result in zip(batch, results):
+                item[3].set_result(result)
+        except Exception as e:
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
 class FinancialGuardian:
     """Main Financial Guardian service class"""
     
     def __init__(self):
         self.fraud_detector = None
         self.monitoring_accounts = set()
-        self.fraud_alerts = {}  # account_id -> list of alerts
-        self.alerts_lock = Lock()
+        self.monitoring_snapshot: Tuple[str, ...] = ()  # rebuilt only when the set changes
+        self.monitoring_lock = Lock()
+        self.fraud_alerts: Dict[str, deque] = {}  # account_id -> newest MAX_ALERTS_PER_ACCOUNT alerts
+        self.check_results = AnalysisCache(CHECK_RESULT_CACHE_SIZE, CHECK_RESULT_TTL_SECONDS)  # job_id -> job
+        self.alerts_lock = Lock()  # only guards creating an account's alert buffer
+        self.alert_stripes = [Lock() for _ in range(ALERT_LOCK_STRIPES)]
         self.monitoring_thread = None
         self.should_monitor = False
         
@@ -354,6 +872,9 @@ class FinancialGuardian:
         self.balance_reader_addr = os.getenv('BALANCE_READER_ADDR', 'balancereader:8080')
         self.pub_key_path = os.getenv('PUB_KEY_PATH', '/tmp/.ssh/publickey')
         
+        # Shared connection pool for all calls to Bank of Anthos services
+        self.http = create_http_session()
+        
         # Initialize AI
         gemini_api_key = os.getenv('GEMINI_API_KEY')
         if gemini_api_key:
@@ -369,6 +890,22 @@ class FinancialGuardian:
         else:
             logger.warning("GEMINI_API_KEY not provided, running in fallback mode")
             self.fraud_detector = FraudDetector("dummy")
+        
+        # All fraud checks share one batching queue in front of the detector
+        self.batch_detector = BatchingFraudDetector(self.fraud_detector)
+    
+    def add_account(self, account_id: str):
+        """Add an account to the monitored set and republish the loop's snapshot"""
+        with self.monitoring_lock:
+            self.monitoring_accounts.add(account_id)
+            self.monitoring_snapshot = tuple(self.monitoring_accounts)
+    
+    def remove_account(self, account_id: str):
+        """Remove an account from the monitored set and republish the loop's snapshot"""
+        with self.monitoring_lock:
+            self.monitoring_accounts.discard(account_id)
+            self.monitoring_snapshot = tuple(self.monitoring_accounts)
+        self.fraud_detector.forget_profile(account_id)
     
     def start_monitoring(self):
         """Start the monitoring thread"""
@@ -386,40 +923,155 @@ class FinancialGuardian:
         logger.info("Transaction monitoring stopped")
     
     def _monitor_transactions(self):
-        """Main monitoring loop - runs in background thread"""
-        while self.should_monitor:
-            try:
-                for account_id in list(self.monitoring_accounts):
-                    self._check_account_transactions(account_id)
-                time.sleep(5)  # Check every 5 seconds
-            except Exception as e:
-                logger.error("Error in monitoring loop", error=str(e))
-                time.sleep(10)  # Wait longer on error
+        """Main monitoring loop - runs its own event loop in the background thread"""
+        asyncio.run(self._monitor_transactions_async())
+    
+    async def _monitor_transactions_async(self):
+        """Fetch every monitored account's history concurrently, then analyze it"""
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(MONITOR_CONCURRENCY)
+        connector = aiohttp.TCPConnector(limit=100, limit_per_host=MONITOR_CONCURRENCY, keepalive_timeout=30)
+        timeout = aiohttp.ClientTimeout(sock_connect=HTTP_TIMEOUT[0], sock_read=HTTP_TIMEOUT[1])
+        
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            while self.should_monitor:
+                try:
+                    accounts = self.monitoring_snapshot
+                    results = await asyncio.gather(
+                        *[self._fetch_history(session, semaphore, account_id) for account_id in accounts],
+                        return_exceptions=True
+                    )
+                    
+                    # Gemini SDK is synchronous, so analysis runs on the default executor
+                    checks = []
+                    for account_id, transactions in zip(accounts, results):
+                        if isinstance(transactions, Exception):
+                            logger.error("Error checking account transactions",
+                                        account_id=account_id, error=str(transactions))
+                        elif transactions:
+                            checks.append(loop.run_in_executor(
+                                None, self._check_account_transactions, account_id, transactions
+                            ))
+                    await asyncio.gather(*checks, return_exceptions=True)
+                    
+                    await asyncio.sleep(MONITOR_INTERVAL_SECONDS)
+                except Exception as e:
+                    logger.error("Error in monitoring loop", error=str(e))
+                    await asyncio.sleep(10)  # Wait longer on error
+    
+    async def _fetch_history(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                             account_id: str) -> List[Dict]:
+        """Fetch an account's transaction history, bounded by the fan-out semaphore"""
+        async with semaphore:
+            async with session.get(
+                f"http://{self.transaction_history_addr}/transactions/{account_id}"
+            ) as response:
+                if response.status != 200:
+                    return []
+                return orjson.loads(await response.read())
     
-    def _check_account_transactions(self, account_id: str):
-        """Check transactions for a specific account"""
+    def _check_account_transactions(self, account_id: str, transactions: List[Dict]):
+        """Check recent transactions for a specific account"""
         try:
-            # Get recent transactions
-            response = requests.get(
-                f"http://{self.transaction_history_addr}/transactions/{account_id}",
-                timeout=10
-            )
+            self.fraud_detector.observe_history(account_id, transactions)
+            # Only transactions not analyzed in an earlier cycle need analysis
+            fresh = self.fraud_detector.claim_unanalyzed(account_id, transactions)
             
-            if response.status_code == 200:
-                transactions = response.json()
+            # Queue every new transaction first so they share a Gemini batch
+            pending = [
+                (transaction, self.batch_detector.submit(transaction, transactions, account_id))
+                for transaction in islice(fresh, max(len(fresh) - 10, 0), None)  # Check newest 10
+            ]
+            for transaction, analysis in pending:
+                self._analyze_transaction(account_id, transaction, analysis)
                 
-                # Check each recent transaction
-                for transaction in transactions[-10:]:  # Check last 10
-                    self._analyze_transaction(account_id, transaction, transactions)
-                    
         except Exception as e:
             logger.error("Error checking account transactions", 
                         account_id=account_id, error=str(e))
     
-    def _analyze_transaction(self, account_id: str, transaction: Dict, history: List[Dict]):
-        """Analyze a single transaction for fraud"""
+    def submit_check(self, job_id: str, transaction: Dict, history: List[Dict],
+                     account_id: Optional[str]) -> Future:
+        """Queue a /fraud/check job; the Future resolves to the complete check response"""
+        self.check_results.put(job_id, {'job_id': job_id, 'status': 'pending'})
+        done = Future()
+        
+        def complete(pending: Future):
+            try:
+                analysis = pending.result()
+                result = {
+                    'job_id': job_id,
+                    'status': 'complete',
+                    'transaction_id': transaction.get('uuid'),
+                    'analysis': analysis,
+                    'user_explanation': self.fraud_detector.generate_user_explanation(
+                        analysis, transaction, history
+                    ),
+                    'timestamp': datetime.now().isoformat()
+                }
+                self.check_results.put(job_id, result)
+                done.set_result(result)
+            except Exception as e:
+                logger.error("Error checking fraud", job_id=job_id, error=str(e))
+                self.check_results.put(job_id, {'job_id': job_id, 'status': 'failed'})
+                done.set_exception(e)
+        
+        self.batch_detector.submit(transaction, history, account_id).add_done_callback(complete)
+        return done
+    
+    def lock_for(self, account_id: str) -> Lock:
+        """Striped lock guarding one account's alerts, so accounts don't contend"""
+        return self.alert_stripes[hash(account_id) & (ALERT_LOCK_STRIPES - 1)]
+    
+    def _alerts_for(self, account_id: str) -> deque:
+        """Alert buffer for an account, created on first use"""
+        alerts = self.fraud_alerts.get(account_id)
+        if alerts is None:
+            with self.alerts_lock:
+                alerts = self.fraud_alerts.setdefault(account_id, deque(maxlen=MAX_ALERTS_PER_ACCOUNT))
+        return alerts
+    
+    def fetch_history(self, account_id: str) -> List[Dict]:
+        """Fetch an account's history from transactionhistory and fold it into its profile"""
+        response = self.http.get(
+            f"http://{self.transaction_history_addr}/transactions/{account_id}",
+            timeout=HTTP_TIMEOUT
+        )
+        if response.status_code != 200:
+            return []
+        history = orjson.loads(response.content)
+        self.fraud_detector.observe_history(account_id, history)
+        return history
+    
+    def ingest_transactions(self, transactions: List[Dict]) -> int:
+        """Queue pushed transactions for every monitored account they touch; returns checks queued"""
+        queued = 0
+        for transaction in transactions:
+            for account_id in {transaction.get('fromAccountNum'), transaction.get('toAccountNum')}:
+                if account_id not in self.monitoring_accounts:
+                    continue
+                
+                # Seed the profile from transactionhistory the first time an account is seen;
+                # without it the transaction is analyzed against what was pushed alone
+                if self.fraud_detector.cached_history(account_id, max_age=float('inf')) is None:
+                    try:
+                        self.fetch_history(account_id)
+                    except Exception as e:
+                        logger.warning("Could not seed account history", account_id=account_id, error=str(e))
+                self.fraud_detector.observe_history(account_id, [transaction])
+                # Marked analyzed here so the polling monitor (or a retried push) doesn't analyze it again
+                if not self.fraud_detector.claim_unanalyzed(account_id, [transaction]):
+                    continue
+                history = self.fraud_detector.cached_history(account_id, max_age=float('inf'))
+                
+                pending = self.batch_detector.submit(transaction, history, account_id)
+                pending.add_done_callback(partial(self._analyze_transaction, account_id, transaction))
+                queued += 1
+        return queued
+    
+    def _analyze_transaction(self, account_id: str, transaction: Dict, pending: Future):
+        """Record the fraud analysis of a single queued transaction"""
         try:
-            analysis = self.fraud_detector.analyze_transaction(transaction, history)
+            analysis = pending.result(timeout=FRAUD_RESULT_TIMEOUT_SECONDS)
             
             if analysis['recommendation'] in ['FLAG', 'BLOCK']:
                 alert = {
@@ -430,10 +1082,9 @@ class FinancialGuardian:
                     'action_taken': analysis['recommendation']
                 }
                 
-                with self.alerts_lock:
-                    if account_id not in self.fraud_alerts:
-                        self.fraud_alerts[account_id] = []
-                    self.fraud_alerts[account_id].append(alert)
+                alerts = self._alerts_for(account_id)
+                with self.lock_for(account_id):
+                    alerts.append(alert)
                 
                 logger.warning("Fraud detected", 
                               account_id=account_id,
@@ -447,22 +1098,31 @@ class FinancialGuardian:
 def create_app():
     """Create and configure Flask application"""
     app = Flask(__name__)
+    app.json = ORJSONProvider(app)
     guardian = FinancialGuardian()
     
+    # Probe and version bodies never change, so they are serialized once and reused
+    ready_response = Response(orjson.dumps({'status': 'ready', 'service': 'financial-guardian'}),
+                              200, mimetype='application/json')
+    healthy_response = Response(orjson.dumps({'status': 'healthy', 'service': 'financial-guardian'}),
+                                200, mimetype='application/json')
+    version_response = Response(orjson.dumps({'version': os.getenv('VERSION', '1.0.0')}),
+                                200, mimetype='application/json')
+    
     @app.route('/ready')
     def readiness():
         """Readiness probe"""
-        return {'status': 'ready', 'service': 'financial-guardian'}, 200
+        return ready_response
     
     @app.route('/healthy')  
     def health():
         """Health check"""
-        return {'status': 'healthy', 'service': 'financial-guardian'}, 200
+        return healthy_response
     
     @app.route('/version')
     def version():
         """Version endpoint"""
-        return {'version': os.getenv('VERSION', '1.0.0')}, 200
+        return version_response
     
     @app.route('/monitor/start', methods=['POST'])
     def start_monitoring():
@@ -473,8 +1133,9 @@ def create_app():
         if not account_id:
             return {'error': 'account_id required'}, 400
         
-        guardian.monitoring_accounts.add(account_id)
-        guardian.start_monitoring()
+        guardian.add_account(account_id)
+        if ENABLE_POLLING:
+            guardian.start_monitoring()
         
         logger.info("Started monitoring account", account_id=account_id)
         return {'message': f'Started monitoring account {account_id}'}, 200
@@ -488,11 +1149,29 @@ def create_app():
         if not account_id:
             return {'error': 'account_id required'}, 400
         
-        guardian.monitoring_accounts.discard(account_id)
+        guardian.remove_account(account_id)
         
         logger.info("Stopped monitoring account", account_id=account_id)
         return {'message': f'Stopped monitoring account {account_id}'}, 200
     
+    @app.route('/fraud/ingest', methods=['POST'])
+    def ingest_transactions():
+        """Accept pushed transactions (one or a list) and analyze them asynchronously"""
+        data = request.get_json()
+        transactions = [data] if isinstance(data, dict) else data
+        
+        if not transactions or not isinstance(transactions, list):
+            return {'error': 'transaction data required'}, 400
+        if not all(isinstance(transaction, dict) for transaction in transactions):
+            return {'error': 'each transaction must be a JSON object'}, 400
+        
+        try:
+            queued = guardian.ingest_transactions(transactions)
+            return {'received': len(transactions), 'queued': queued}, 202
+        except Exception as e:
+            logger.error("Error ingesting transactions", error=str(e))
+            return {'error': 'Internal server error'}, 500
+    
     @app.route('/fraud/check', methods=['POST'])
     def check_fraud():
         """Check if a transaction is fraudulent"""
@@ -506,33 +1185,46 @@ def create_app():
             account_id = transaction.get('fromAccountNum')
             history = []
             
-            if account_id:
-                response = requests.get(
-                    f"http://{guardian.transaction_history_addr}/transactions/{account_id}",
-                    timeout=10
-                )
-                if response.status_code == 200:
-                    history = response.json()
+            cached = guardian.fraud_detector.cached_history(account_id) if account_id else None
+            if cached is not None:
+                # Monitored (or just-checked) accounts are served from the local profile
+                history = cached
+            elif account_id:
+                history = guardian.fetch_history(account_id)
             
-            # Analyze transaction
-            analysis = guardian.fraud_detector.analyze_transaction(transaction, history)
+            # Queue the analysis; results are polled from /fraud/result/<job_id>
+            job_id = transaction.get('uuid') or uuid4().hex
+            done = guardian.submit_check(job_id, transaction, history, account_id)
             
-            # Generate user-friendly explanation
-            user_explanation = guardian.fraud_detector.generate_user_explanation(
-                analysis, transaction, history
-            )
+            if request.args.get('wait') == '1':
+                try:
+                    return done.result(timeout=CHECK_WAIT_SECONDS), 200
+                except FutureTimeoutError:
+                    pass  # still running: hand back the job handle instead
             
             return {
-                'transaction_id': transaction.get('uuid'),
-                'analysis': analysis,
-                'user_explanation': user_explanation,
-                'timestamp': datetime.now().isoformat()
-            }, 200
+                'job_id': job_id,
+                'status': 'pending',
+                'result_url': f'/fraud/result/{job_id}'
+            }, 202
             
         except Exception as e:
             logger.error("Error checking fraud", error=str(e))
             return {'error': 'Internal server error'}, 500
     
+    @app.route('/fraud/result/<job_id>')
+    def get_check_result(job_id):
+        """Poll the result of a /fraud/check job"""
+        job = guardian.check_results.get(job_id)
+        
+        if job is None:
+            return {'error': 'unknown or expired job_id'}, 404
+        if job['status'] == 'pending':
+            return job, 202
+        if job['status'] == 'failed':
+            return {'job_id': job_id, 'error': 'Internal server error'}, 500
+        return job, 200
+    
     @app.route('/fraud/alerts')
     def get_alerts():
         """Get fraud alerts for an account"""
@@ -541,8 +1233,16 @@ def create_app():
         if not account_id:
             return {'error': 'account_id parameter required'}, 400
         
-        with guardian.alerts_lock:
-            alerts = guardian.fraud_alerts.get(account_id, [])
+        limit = request.args.get('limit', type=int)
+        since = request.args.get('since')
+        
+        with guardian.lock_for(account_id):
+            alerts = list(guardian.fraud_alerts.get(account_id, ()))
+        
+        if since:
+            alerts = [alert for alert in alerts if alert['timestamp'] > since]
+        if limit is not None and limit >= 0:
+            alerts = alerts[-limit:] if limit else []
         
         return {'account_id': account_id, 'alerts': alerts}, 200
     
@@ -558,6 +1258,7 @@ def create_app():
     return app
 
 if __name__ == '__main__':
+    # Local development only; containers run gunicorn with gunicorn_conf.py
     # Configure logging level
     log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
     logging.basicConfig(level=getattr(logging, log_level))
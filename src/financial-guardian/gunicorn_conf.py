@@ -0,0 +1,24 @@
+"""
+Gunicorn configuration for the Financial Guardian service
+
+Monitoring state, fraud alerts and the Gemini batch queue live in process
+memory, so the service runs as a single worker and gets its concurrency from
+threads: a /fraud/check blocked on Gemini only occupies one of them.
+"""
+
+import os
+
+bind = f":{os.getenv('PORT', '8081')}"
+
+workers = 1
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', '32'))
+
+# Reuse connections from the frontend and probes; fail requests stuck past the Gemini timeout
+keepalive = 30
+timeout = 30
+graceful_timeout = 10
+
+loglevel = os.getenv('LOG_LEVEL', 'info').lower()
+accesslog = None
+errorlog = '-'
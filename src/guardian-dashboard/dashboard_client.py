@@ -5,21 +5,244 @@ Dashboard Client - Helper for Guardian agents to send data to the dashboard
 """
 
 import asyncio
-import json
-import uuid
+import gzip
+import queue
+import reprlib
+import secrets
+import threading
+import time
+from collections import Counter, defaultdict
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple, Union
 import httpx
+import orjson
+import requests
 import structlog
 
 logger = structlog.get_logger()
 
+# Pooled connections for the sync decorator path
+_sync_session = requests.Session()
+
+# Sync calls hand their dashboard POST to a daemon thread instead of waiting on it
+_sync_queue: "queue.Queue[Tuple[str, Dict[str, Any]]]" = queue.Queue(maxsize=10_000)
+_sync_worker: Optional[threading.Thread] = None
+_sync_worker_lock = threading.Lock()
+
+# Truncating repr for logged arguments and results; stops building at the limit
+# instead of rendering the whole object and slicing it afterwards
+_repr = reprlib.Repr()
+_repr.maxstring = 200
+_repr.maxother = 200
+
+# Bodies larger than this are gzip-compressed before they are posted
+COMPRESS_MIN_BYTES = 1024
+
+# Most events of each channel allowed in flight (queued or being posted) before new
+# ones are dropped; channels not listed here, such as fraud_alert, are never dropped
+DEFAULT_CHANNEL_LIMITS = {"conversation": 10_000, "api_call": 5_000}
+
+def encode_body(payload: Dict[str, Any]) -> Tuple[bytes, Dict[str, str]]:
+    """Serialize a payload to JSON, compressing it when it is large enough to matter"""
+    return compress_body(orjson.dumps(payload))
+
+def compress_body(body: bytes) -> Tuple[bytes, Dict[str, str]]:
+    """Gzip an encoded JSON body above COMPRESS_MIN_BYTES and return it with its headers"""
+    headers = {"Content-Type": "application/json"}
+    if len(body) > COMPRESS_MIN_BYTES:
+        body = gzip.compress(body, compresslevel=1)
+        headers["Content-Encoding"] = "gzip"
+    return body, headers
+
+def _sync_send_loop():
+    """Post queued sync-path events one by one, ignoring failures"""
+    while True:
+        url, payload = _sync_queue.get()
+        try:
+            body, headers = encode_body(payload)
+            _sync_session.post(url, data=body, headers=headers, timeout=5)
+        except Exception as e:
+            logger.debug("Could not send API call to dashboard", error=str(e))
+
+def _post_in_background(url: str, payload: Dict[str, Any]):
+    """Queue a POST for the sync worker thread, starting it on first use"""
+    global _sync_worker
+    if _sync_worker is None:
+        with _sync_worker_lock:
+            if _sync_worker is None:
+                _sync_worker = threading.Thread(target=_sync_send_loop, name="dashboard-sync-sender", daemon=True)
+                _sync_worker.start()
+    try:
+        _sync_queue.put_nowait((url, payload))
+    except queue.Full:
+        logger.debug("Dashboard sync queue full, dropping event")
+
 class DashboardClient:
     """Client for sending data to the Guardian Dashboard"""
     
-    def __init__(self, dashboard_url: str = "http://guardian-dashboard:8080"):
+    def __init__(
+        self,
+        dashboard_url: str = "http://guardian-dashboard:8080",
+        max_batch_size: int = 200,
+        flush_interval_ms: int = 50,
+        channel_limits: Optional[Dict[str, int]] = None,
+        max_payload_bytes: int = 64 * 1024
+    ):
         self.dashboard_url = dashboard_url
         self.agent_name = None
+        self._client: Optional[httpx.AsyncClient] = None
+        
+        # Events are queued and posted in batches of up to max_batch_size,
+        # collected for at most flush_interval_ms after the first one arrives;
+        # a batch is split so no single POST body exceeds max_payload_bytes
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_payload_bytes = max_payload_bytes
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher: Optional[asyncio.Task] = None
+        
+        # Back-pressure per channel (conversation message_type, or "api_call")
+        self.channel_limits = DEFAULT_CHANNEL_LIMITS if channel_limits is None else channel_limits
+        self._inflight = Counter()
+        self.dropped = Counter()
+        
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Long-lived HTTP client, created on first use so connections are kept alive"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.dashboard_url,
+                timeout=5.0,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=60)
+            )
+        return self._client
+        
+    def start(self):
+        """Start the background flusher on the running event loop"""
+        if self._flusher is None or self._flusher.done():
+            # Carry over events a stopped or failed flusher left behind and recount what is in flight
+            pending = []
+            while self._queue is not None and not self._queue.empty():
+                item = self._queue.get_nowait()
+                if item is not None:
+                    pending.append(item)
+            self._queue = asyncio.Queue()
+            self._inflight = Counter(channel for _, channel, _ in pending)
+            for item in pending:
+                self._queue.put_nowait(item)
+            self._flusher = asyncio.get_running_loop().create_task(self._flush_loop())
+            
+    def _encode(self, channel: str, payload: Dict[str, Any]) -> Optional[bytes]:
+        """Encode an event, or count it as dropped if it holds values JSON can't represent"""
+        try:
+            return orjson.dumps(payload)
+        except orjson.JSONEncodeError as e:
+            self.dropped[channel] += 1
+            logger.warning("Dashboard event is not JSON serializable, dropping it", channel=channel, error=str(e))
+            return None
+            
+    def _enqueue(self, path: str, channel: str, payload: Union[Dict[str, Any], bytes]):
+        """Encode and queue an event for the next batch unless its channel is over its in-flight limit"""
+        limit = self.channel_limits.get(channel)
+        if limit is not None and self._inflight[channel] >= limit:
+            self.dropped[channel] += 1
+            logger.debug("Dashboard channel over limit, dropping event", channel=channel)
+            return
+            
+        # Encoded here so a bad payload is rejected alone instead of failing the whole batch
+        if not isinstance(payload, bytes):
+            payload = self._encode(channel, payload)
+            if payload is None:
+                return
+            
+        self.start()
+        self._inflight[channel] += 1
+        self._queue.put_nowait((path, channel, payload))
+            
+    async def _flush_loop(self):
+        """Drain the queue into batched POSTs until aclose() enqueues None"""
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                break
+            batch = [item]
+            
+            try:
+                # Give a burst a moment to accumulate unless a full batch is already waiting
+                if self._queue.qsize() < self.max_batch_size - 1:
+                    await asyncio.sleep(self.flush_interval)
+                while len(batch) < self.max_batch_size and not self._queue.empty():
+                    item = self._queue.get_nowait()
+                    if item is None:
+                        stopping = True
+                        self._queue.task_done()
+                        break
+                    batch.append(item)
+                    
+                await self._post_batch(batch)
+            except Exception as e:
+                logger.warning("Could not post dashboard batch", count=len(batch), error=str(e))
+            finally:
+                # Every dequeued event leaves the in-flight count, whether or not it was sent
+                for _, channel, _ in batch:
+                    self._inflight[channel] -= 1
+                    self._queue.task_done()
+                
+    async def flush(self):
+        """Wait until every event queued so far has been posted"""
+        if self._flusher is not None and not self._flusher.done():
+            await self._queue.join()
+            
+    async def _post_batch(self, batch: List[Tuple[str, str, bytes]]):
+        """Send the batch as POSTs per event kind, each kept under max_payload_bytes"""
+        items_by_path = defaultdict(list)
+        for path, channel, fragment in batch:
+            items_by_path[path].append((channel, fragment))
+            
+        for path, items in items_by_path.items():
+            chunk, size = [], 0
+            for channel, fragment in items:
+                if chunk and size + len(fragment) > self.max_payload_bytes:
+                    await self._post_items(path, chunk)
+                    chunk, size = [], 0
+                chunk.append((channel, fragment))
+                size += len(fragment) + 1
+            await self._post_items(path, chunk)
+            
+    async def _post_items(self, path: str, items: List[Tuple[str, bytes]]):
+        """POST already-encoded events as one {"items": [...]} body"""
+        try:
+            body, headers = compress_body(
+                b'{"items":[' + b",".join(fragment for _, fragment in items) + b"]}"
+            )
+            response = await self.client.post(f"{path}/batch", content=body, headers=headers)
+            if response.status_code == 200:
+                logger.debug("Batch sent to dashboard", path=path, count=len(items))
+            else:
+                logger.warning("Failed to send batch", path=path, status=response.status_code)
+        except Exception as e:
+            logger.debug("Could not send batch to dashboard", path=path, error=str(e))
+                
+    async def aclose(self):
+        """Flush queued events and close the underlying HTTP client"""
+        if self._flusher is not None and not self._flusher.done():
+            await self._queue.put(None)
+            await self._flusher
+        self._flusher = None
+        
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            
+    async def __aenter__(self):
+        """Run the flusher (and its pooled connection) for the duration of the block"""
+        self.start()
+        return self
+        
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
         
     def set_agent_name(self, name: str):
         """Set the agent name for this client"""
@@ -31,17 +254,19 @@ class DashboardClient:
         to_agent: Optional[str] = None,
         message_type: str = "conversation",
         correlation_id: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        agent_name: Optional[str] = None
     ):
-        """Send a conversation message to the dashboard"""
-        if not self.agent_name:
+        """Queue a conversation message for the dashboard, sent as agent_name or the client's agent"""
+        agent_name = agent_name or self.agent_name
+        if not agent_name:
             logger.warning("Agent name not set, skipping conversation")
             return
             
         payload = {
-            "id": str(uuid.uuid4()),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "from_agent": self.agent_name,
+            "id": secrets.token_hex(16),
+            "timestamp": datetime.now(timezone.utc),
+            "from_agent": agent_name,
             "to_agent": to_agent,
             "message_type": message_type,
             "content": message,
@@ -49,66 +274,73 @@ class DashboardClient:
             "metadata": metadata or {}
         }
         
-        try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.post(
-                    f"{self.dashboard_url}/api/conversations",
-                    json=payload
-                )
-                if response.status_code == 200:
-                    logger.debug("Conversation sent to dashboard", message=message[:50])
-                else:
-                    logger.warning("Failed to send conversation", status=response.status_code)
-        except Exception as e:
-            logger.debug("Could not send conversation to dashboard", error=str(e))
+        self._enqueue("/api/conversations", message_type, payload)
     
     async def send_api_call(
         self,
         method: str,
         endpoint: str,
-        request_data: Dict[str, Any],
-        response_data: Dict[str, Any],
+        request_data: Optional[Dict[str, Any]],
+        response_data: Optional[Dict[str, Any]],
         duration_ms: int,
         status_code: int,
-        correlation_id: Optional[str] = None
+        correlation_id: Optional[str] = None,
+        agent_name: Optional[str] = None,
+        request_json: Optional[bytes] = None,
+        response_json: Optional[bytes] = None,
+        parent_trace_id: Optional[str] = None
     ):
-        """Send API call data to the dashboard"""
-        if not self.agent_name:
+        """Queue API call data for the dashboard, sent as agent_name or the client's agent
+
+        request_json / response_json take already-encoded JSON in place of
+        request_data / response_data, so fixed payloads are not re-serialized per call.
+        """
+        agent_name = agent_name or self.agent_name
+        if not agent_name:
             logger.warning("Agent name not set, skipping API call")
             return
             
         payload = {
-            "id": str(uuid.uuid4()),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "service": self.agent_name,
+            "id": secrets.token_hex(16),
+            "timestamp": datetime.now(timezone.utc),
+            "service": agent_name,
             "method": method,
             "endpoint": endpoint,
-            "request_data": request_data,
-            "response_data": response_data,
+            "request_data": request_data or {},
+            "response_data": response_data or {},
             "duration_ms": duration_ms,
             "status_code": status_code,
-            "correlation_id": correlation_id
+            "correlation_id": correlation_id,
+            "parent_trace_id": parent_trace_id
         }
         
-        try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.post(
-                    f"{self.dashboard_url}/api/api-calls",
-                    json=payload
-                )
-                if response.status_code == 200:
-                    logger.debug("API call sent to dashboard", endpoint=endpoint)
-                else:
-                    logger.warning("Failed to send API call", status=response.status_code)
-        except Exception as e:
-            logger.debug("Could not send API call to dashboard", error=str(e))
+        if request_json is None and response_json is None:
+            self._enqueue("/api/api-calls", "api_call", payload)
+            return
+            
+        # Splice the pre-encoded bodies into the encoded event
+        fields = []
+        if request_json is not None:
+            del payload["request_data"]
+            fields.append(b'"request_data":' + request_json)
+        if response_json is not None:
+            del payload["response_data"]
+            fields.append(b'"response_data":' + response_json)
+        raw = self._encode("api_call", payload)
+        if raw is None:
+            return
+        self._enqueue("/api/api-calls", "api_call", raw[:-1] + b"," + b",".join(fields) + b"}")
 
 # Decorator for automatic API call logging
 def log_api_call(dashboard_client: DashboardClient, correlation_id: Optional[str] = None):
     """Decorator to automatically log API calls to the dashboard"""
     def decorator(func):
+        # Fixed per decorated function, so worked out once here
+        endpoint = f"/{func.__name__}"
+        
         async def async_wrapper(*args, **kwargs):
-            start_time = asyncio.get_event_loop().time()
+            loop = asyncio.get_running_loop()
+            start_time = loop.time()
             
             # Extract request data from function arguments
             request_data = {}
@@ -117,11 +349,11 @@ def log_api_call(dashboard_client: DashboardClient, correlation_id: Optional[str
                 if 'request' in kwargs:
                     request_data = getattr(kwargs['request'], 'dict', lambda: {})()
                 elif len(args) > 1:
-                    request_data = {"args": str(args[1:])[:200]}
+                    request_data = {"args": _repr.repr(args[1:])}
             
             try:
                 result = await func(*args, **kwargs)
-                end_time = asyncio.get_event_loop().time()
+                end_time = loop.time()
                 duration_ms = int((end_time - start_time) * 1000)
                 
                 # Extract response data
@@ -131,12 +363,12 @@ def log_api_call(dashboard_client: DashboardClient, correlation_id: Optional[str
                 elif isinstance(result, dict):
                     response_data = result
                 else:
-                    response_data = {"result": str(result)[:200]}
+                    response_data = {"result": _repr.repr(result)}
                 
                 # Send to dashboard
                 await dashboard_client.send_api_call(
                     method="POST",  # Assume POST for async functions
-                    endpoint=f"/{func.__name__}",
+                    endpoint=endpoint,
                     request_data=request_data,
                     response_data=response_data,
                     duration_ms=duration_ms,
@@ -147,12 +379,12 @@ def log_api_call(dashboard_client: DashboardClient, correlation_id: Optional[str
                 return result
                 
             except Exception as e:
-                end_time = asyncio.get_event_loop().time()
+                end_time = loop.time()
                 duration_ms = int((end_time - start_time) * 1000)
                 
                 await dashboard_client.send_api_call(
                     method="POST",
-                    endpoint=f"/{func.__name__}",
+                    endpoint=endpoint,
                     request_data=request_data,
                     response_data={"error": str(e)},
                     duration_ms=duration_ms,
@@ -164,14 +396,13 @@ def log_api_call(dashboard_client: DashboardClient, correlation_id: Optional[str
                 
         def sync_wrapper(*args, **kwargs):
             # For sync functions, create a simple wrapper
-            import time
-            start_time = time.time()
+            start_time = time.perf_counter()
             
-            request_data = {"args": str(args[1:])[:200] if len(args) > 1 else {}}
+            request_data = {"args": _repr.repr(args[1:]) if len(args) > 1 else {}}
             
             try:
                 result = func(*args, **kwargs)
-                end_time = time.time()
+                end_time = time.perf_counter()
                 duration_ms = int((end_time - start_time) * 1000)
                 
                 response_data = {}
@@ -180,56 +411,40 @@ def log_api_call(dashboard_client: DashboardClient, correlation_id: Optional[str
                 elif isinstance(result, dict):
                     response_data = result
                 else:
-                    response_data = {"result": str(result)[:200]}
+                    response_data = {"result": _repr.repr(result)}
                 
-                # Send to dashboard (sync version)
-                try:
-                    import requests
-                    requests.post(
-                        f"{dashboard_client.dashboard_url}/api/api-calls",
-                        json={
-                            "id": str(uuid.uuid4()),
-                            "timestamp": datetime.now(timezone.utc).isoformat(),
-                            "service": dashboard_client.agent_name,
-                            "method": "POST",
-                            "endpoint": f"/{func.__name__}",
-                            "request_data": request_data,
-                            "response_data": response_data,
-                            "duration_ms": duration_ms,
-                            "status_code": 200,
-                            "correlation_id": correlation_id
-                        },
-                        timeout=5
-                    )
-                except:
-                    pass  # Fail silently
+                # Send to dashboard (sync version, posted by the background thread)
+                _post_in_background(f"{dashboard_client.dashboard_url}/api/api-calls", {
+                    "id": secrets.token_hex(16),
+                    "timestamp": datetime.now(timezone.utc),
+                    "service": dashboard_client.agent_name,
+                    "method": "POST",
+                    "endpoint": endpoint,
+                    "request_data": request_data,
+                    "response_data": response_data,
+                    "duration_ms": duration_ms,
+                    "status_code": 200,
+                    "correlation_id": correlation_id
+                })
                 
                 return result
                 
             except Exception as e:
-                end_time = time.time()
+                end_time = time.perf_counter()
                 duration_ms = int((end_time - start_time) * 1000)
                 
-                try:
-                    import requests
-                    requests.post(
-                        f"{dashboard_client.dashboard_url}/api/api-calls",
-                        json={
-                            "id": str(uuid.uuid4()),
-                            "timestamp": datetime.now(timezone.utc).isoformat(),
-                            "service": dashboard_client.agent_name,
-                            "method": "POST",
-                            "endpoint": f"/{func.__name__}",
-                            "request_data": request_data,
-                            "response_data": {"error": str(e)},
-                            "duration_ms": duration_ms,
-                            "status_code": 500,
-                            "correlation_id": correlation_id
-                        },
-                        timeout=5
-                    )
-                except:
-                    pass  # Fail silently
+                _post_in_background(f"{dashboard_client.dashboard_url}/api/api-calls", {
+                    "id": secrets.token_hex(16),
+                    "timestamp": datetime.now(timezone.utc),
+                    "service": dashboard_client.agent_name,
+                    "method": "POST",
+                    "endpoint": endpoint,
+                    "request_data": request_data,
+                    "response_data": {"error": str(e)},
+                    "duration_ms": duration_ms,
+                    "status_code": 500,
+                    "correlation_id": correlation_id
+                })
                 
                 raise
         
@@ -240,35 +455,49 @@ def log_api_call(dashboard_client: DashboardClient, correlation_id: Optional[str
 dashboard_client = DashboardClient()
 
 # Convenience functions
-async def log_conversation(message: str, to_agent: str = None, correlation_id: str = None):
+def _trace_metadata(metadata: Dict[str, Any], parent_trace_id: Optional[str]) -> Dict[str, Any]:
+    """Attach the parent trace id, when given, to an event's metadata"""
+    if parent_trace_id:
+        metadata["parent_trace_id"] = parent_trace_id
+    return metadata
+
+async def log_conversation(message: str, to_agent: str = None, correlation_id: str = None, agent_name: str = None,
+                           parent_trace_id: str = None):
     """Quick function to log a conversation message"""
     await dashboard_client.send_conversation(
         message=message,
         to_agent=to_agent,
-        correlation_id=correlation_id
+        correlation_id=correlation_id,
+        metadata=_trace_metadata({}, parent_trace_id),
+        agent_name=agent_name
     )
 
-async def log_coordination_event(message: str, correlation_id: str, agents: list):
+async def log_coordination_event(message: str, correlation_id: str, agents: list, agent_name: str = None,
+                                 parent_trace_id: str = None):
     """Log a multi-agent coordination event"""
     await dashboard_client.send_conversation(
         message=f"🤝 Coordination: {message}",
         to_agent=", ".join(agents),
         message_type="coordination",
         correlation_id=correlation_id,
-        metadata={"agents": agents}
+        metadata=_trace_metadata({"agents": agents}, parent_trace_id),
+        agent_name=agent_name
     )
 
-async def log_fraud_detection(transaction_id: str, fraud_score: float, action: str, correlation_id: str = None):
+async def log_fraud_detection(transaction_id: str, fraud_score: float, action: str, correlation_id: str = None, agent_name: str = None,
+                              parent_trace_id: str = None):
     """Log a fraud detection event"""
     await dashboard_client.send_conversation(
         message=f"🚨 Fraud detected: Transaction {transaction_id} (score: {fraud_score:.2f}) → {action}",
         to_agent="ops-guardian",
         message_type="fraud_alert",
         correlation_id=correlation_id,
-        metadata={"transaction_id": transaction_id, "fraud_score": fraud_score, "action": action}
+        metadata=_trace_metadata({"transaction_id": transaction_id, "fraud_score": fraud_score, "action": action}, parent_trace_id),
+        agent_name=agent_name
     )
 
-async def log_scaling_event(service: str, old_replicas: int, new_replicas: int, reason: str, correlation_id: str = None):
+async def log_scaling_event(service: str, old_replicas: int, new_replicas: int, reason: str, correlation_id: str = None, agent_name: str = None,
+                            parent_trace_id: str = None):
     """Log a scaling event"""
     direction = "↗️" if new_replicas > old_replicas else "↘️"
     await dashboard_client.send_conversation(
@@ -276,5 +505,6 @@ async def log_scaling_event(service: str, old_replicas: int, new_replicas: int,
         to_agent="financial-guardian",
         message_type="scaling_event",
         correlation_id=correlation_id,
-        metadata={"service": service, "old_replicas": old_replicas, "new_replicas": new_replicas, "reason": reason}
+        metadata=_trace_metadata({"service": service, "old_replicas": old_replicas, "new_replicas": new_replicas, "reason": reason}, parent_trace_id),
+        agent_name=agent_name
     )
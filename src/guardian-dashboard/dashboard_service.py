@@ -6,19 +6,21 @@ Aggregates and visualizes communication between Financial, Ops, and Explainer ag
 """
 
 import os
+import gzip
 import json
 import asyncio
-import uuid
+import secrets
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
-from collections import defaultdict, deque
+from collections import OrderedDict, deque
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, BackgroundTasks, Request, HTTPException
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.responses import HTMLResponse, FileResponse, ORJSONResponse, PlainTextResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 import httpx
+import orjson
 import structlog
 from pydantic import BaseModel
 
@@ -43,6 +45,48 @@ structlog.configure(
 
 logger = structlog.get_logger()
 
+# Correlation tracking bounds: least recently active ids are evicted first
+MAX_CORRELATIONS = int(os.getenv("MAX_CORRELATIONS", "5000"))
+MAX_EVENTS_PER_CORRELATION = int(os.getenv("MAX_EVENTS_PER_CORRELATION", "200"))
+
+def dumps_json(obj: Any) -> bytes:
+    """Serialize to JSON bytes; datetimes without a timezone are written as UTC"""
+    return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC)
+
+def join_json_array(fragments) -> bytes:
+    """Combine already-encoded JSON values into an encoded array"""
+    return b"[" + b",".join(fragments) + b"]"
+
+class RecordRing:
+    """Fixed-size ring of encoded records; the oldest record is overwritten when full"""
+    
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._slots: List[Optional[bytes]] = [None] * capacity
+        self._head = 0  # Sequence number of the next record
+        
+    def __len__(self) -> int:
+        return min(self._head, self.capacity)
+        
+    def append(self, raw: bytes) -> int:
+        """Store a record and return its sequence number"""
+        seq = self._head
+        self._slots[seq % self.capacity] = raw
+        self._head = seq + 1
+        return seq
+        
+    def get(self, seq: int) -> Optional[bytes]:
+        """Record with the given sequence number, or None once it has been overwritten"""
+        if self._head - self.capacity <= seq < self._head:
+            return self._slots[seq % self.capacity]
+        return None
+        
+    def tail(self, n: int):
+        """Yield the last n records, oldest first"""
+        start = self._head - min(n, len(self))
+        for seq in range(start, self._head):
+            yield self._slots[seq % self.capacity]
+
 # Pydantic Models
 class AgentMessage(BaseModel):
     id: str
@@ -65,6 +109,13 @@ class APICall(BaseModel):
     duration_ms: int
     status_code: int
     correlation_id: Optional[str] = None
+    parent_trace_id: Optional[str] = None
+
+class AgentMessageBatch(BaseModel):
+    items: List[AgentMessage]
+
+class APICallBatch(BaseModel):
+    items: List[APICall]
 
 class AgentState(BaseModel):
     agent_name: str
@@ -83,12 +134,21 @@ class DemoScenario(BaseModel):
 # Dashboard Service
 class GuardianDashboard:
     def __init__(self):
-        self.conversations = deque(maxlen=1000)  # Last 1000 messages
-        self.api_calls = deque(maxlen=1000)     # Last 1000 API calls
+        # Records are kept as encoded JSON, serialized once when they arrive
+        self.conversations = RecordRing(1000)  # Last 1000 messages
+        self.api_calls = RecordRing(1000)      # Last 1000 API calls
         self.agent_states = {}
-        self.active_correlations = defaultdict(list)
+        self._agent_state_data = {}
+        self._agent_state_signatures = {}
+        # Correlations reference records by (kind, sequence number) in the rings
+        # above rather than holding a second copy of each event
+        self.active_correlations: "OrderedDict[str, deque]" = OrderedDict()
         self.websocket_connections = set()
         
+        # Encoded dashboard snapshot, rebuilt only after something changed
+        self._snapshot_bytes: Optional[bytes] = None
+        self._initial_frame: Optional[bytes] = None
+        
         # Agent service URLs
         self.services = {
             "financial-guardian": os.getenv("FINANCIAL_GUARDIAN_URL", "http://financial-guardian:8081"),
@@ -96,18 +156,24 @@ class GuardianDashboard:
             "explainer-agent": os.getenv("EXPLAINER_AGENT_URL", "http://explainer-agent:8082")
         }
         
+        # Persistent client for health checks so each poll reuses open connections
+        self._monitor_client = httpx.AsyncClient(
+            timeout=5.0,
+            limits=httpx.Limits(max_keepalive_connections=10)
+        )
+        
     async def add_conversation(self, message: AgentMessage):
         """Add a new agent conversation message"""
-        self.conversations.append(message)
+        raw = dumps_json(message.dict())
+        seq = self.conversations.append(raw)
+        self._snapshot_bytes = None
         
         # Group by correlation_id if present
         if message.correlation_id:
-            self.active_correlations[message.correlation_id].append(message)
+            self._track_correlation(message.correlation_id, ("conversation", seq))
             
         # Broadcast to all connected WebSocket clients
-        message_dict = message.dict()
-        message_dict['timestamp'] = message_dict['timestamp'].isoformat()
-        await self._broadcast_update("conversation", message_dict)
+        await self._broadcast_update("conversation", raw)
         
         logger.info("Agent conversation logged", 
                    from_agent=message.from_agent,
@@ -116,16 +182,16 @@ class GuardianDashboard:
     
     async def add_api_call(self, api_call: APICall):
         """Add a new API call record"""
-        self.api_calls.append(api_call)
+        raw = dumps_json(api_call.dict())
+        seq = self.api_calls.append(raw)
+        self._snapshot_bytes = None
         
         # Group by correlation_id if present
         if api_call.correlation_id:
-            self.active_correlations[api_call.correlation_id].append(api_call)
+            self._track_correlation(api_call.correlation_id, ("api_call", seq))
             
         # Broadcast to WebSocket clients
-        api_call_dict = api_call.dict()
-        api_call_dict['timestamp'] = api_call_dict['timestamp'].isoformat()
-        await self._broadcast_update("api_call", api_call_dict)
+        await self._broadcast_update("api_call", raw)
         
         logger.info("API call logged",
                    service=api_call.service,
@@ -133,108 +199,181 @@ class GuardianDashboard:
                    duration=api_call.duration_ms,
                    status=api_call.status_code)
     
+    def _track_correlation(self, correlation_id: str, ref: Tuple[str, int]):
+        """Record an event under its correlation id, keeping both dimensions bounded"""
+        events = self.active_correlations.get(correlation_id)
+        if events is None:
+            events = self.active_correlations[correlation_id] = deque(maxlen=MAX_EVENTS_PER_CORRELATION)
+            if len(self.active_correlations) > MAX_CORRELATIONS:
+                self.active_correlations.popitem(last=False)
+        else:
+            self.active_correlations.move_to_end(correlation_id)
+        events.append(ref)
+    
+    def get_correlation_events(self, correlation_id: str) -> List[bytes]:
+        """Encoded events for a correlation id that are still held in the history rings"""
+        rings = {"conversation": self.conversations, "api_call": self.api_calls}
+        events = []
+        for kind, seq in self.active_correlations.get(correlation_id, ()):
+            raw = rings[kind].get(seq)
+            if raw is not None:
+                events.append(raw)
+        return events
+    
     async def update_agent_state(self, state: AgentState):
         """Update agent state"""
         self.agent_states[state.agent_name] = state
-        state_dict = state.dict()
-        state_dict['last_update'] = state_dict['last_update'].isoformat()
-        await self._broadcast_update("agent_state", state_dict)
+        raw = dumps_json(state.dict())
+        self._agent_state_data[state.agent_name] = raw
+        self._snapshot_bytes = None
+        
+        # Health polls mostly repeat the previous state; only a real change is pushed to clients
+        signature = (state.status, sorted(state.metrics.items()), state.active_operations)
+        if self._agent_state_signatures.get(state.agent_name) == signature:
+            return
+        self._agent_state_signatures[state.agent_name] = signature
+        
+        await self._broadcast_update("agent_state", raw)
         
         logger.info("Agent state updated", 
                    agent=state.agent_name, 
                    status=state.status)
     
-    async def _broadcast_update(self, update_type: str, data: Dict[str, Any]):
-        """Broadcast update to all WebSocket connections"""
+    async def _broadcast_update(self, update_type: str, data: bytes):
+        """Broadcast an encoded record to all WebSocket connections"""
         if not self.websocket_connections:
             return
             
-        message = {
-            "type": update_type,
-            "data": data,
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        }
+        frame = b"".join((
+            b'{"type":"', update_type.encode(), b'","data":', data,
+            b',"timestamp":', dumps_json(datetime.now(timezone.utc)), b"}"
+        ))
         
-        # Send to all connected clients
-        disconnected = set()
-        for websocket in self.websocket_connections:
-            try:
-                await websocket.send_json(message)
-            except Exception:
-                disconnected.add(websocket)
+        # Send to all connected clients at once so a slow client does not delay the rest
+        clients = list(self.websocket_connections)
+        results = await asyncio.gather(
+            *(websocket.send_bytes(frame) for websocket in clients),
+            return_exceptions=True
+        )
         
         # Remove disconnected clients
-        self.websocket_connections -= disconnected
-    
-    async def get_dashboard_data(self) -> Dict[str, Any]:
-        """Get current dashboard data"""
-        # Serialize conversations with proper datetime handling
-        conversations = []
-        for msg in list(self.conversations)[-50:]:
-            msg_dict = msg.dict()
-            msg_dict['timestamp'] = msg_dict['timestamp'].isoformat()
-            conversations.append(msg_dict)
-        
-        # Serialize API calls with proper datetime handling
-        api_calls = []
-        for call in list(self.api_calls)[-50:]:
-            call_dict = call.dict()
-            call_dict['timestamp'] = call_dict['timestamp'].isoformat()
-            api_calls.append(call_dict)
-        
-        # Serialize agent states with proper datetime handling
-        agent_states = {}
-        for name, state in self.agent_states.items():
-            state_dict = state.dict()
-            state_dict['last_update'] = state_dict['last_update'].isoformat()
-            agent_states[name] = state_dict
-        
-        return {
-            "conversations": conversations,
-            "api_calls": api_calls,
-            "agent_states": agent_states,
-            "active_correlations": len(self.active_correlations),
-            "total_conversations": len(self.conversations),
-            "total_api_calls": len(self.api_calls)
+        self.websocket_connections -= {
+            websocket for websocket, result in zip(clients, results)
+            if isinstance(result, Exception)
         }
     
+    async def get_dashboard_data(self) -> bytes:
+        """Get current dashboard data as encoded JSON"""
+        if self._snapshot_bytes is None:
+            agent_states = b",".join(
+                dumps_json(name) + b":" + raw for name, raw in self._agent_state_data.items()
+            )
+            counts = dumps_json({
+                "active_correlations": len(self.active_correlations),
+                "total_conversations": len(self.conversations),
+                "total_api_calls": len(self.api_calls)
+            })
+            self._snapshot_bytes = b"".join((
+                b'{"conversations":', join_json_array(self.conversations.tail(50)),
+                b',"api_calls":', join_json_array(self.api_calls.tail(50)),
+                b',"agent_states":{', agent_states, b"},",
+                counts[1:]
+            ))
+            self._initial_frame = None
+        return self._snapshot_bytes
+    
+    async def get_initial_frame(self) -> bytes:
+        """WebSocket frame carrying the snapshot, shared by every client that connects"""
+        snapshot = await self.get_dashboard_data()
+        if self._initial_frame is None:
+            self._initial_frame = b'{"type":"initial_data","data":' + snapshot + b"}"
+        return self._initial_frame
+    
     async def monitor_agents(self):
         """Background task to monitor agent health"""
         while True:
             try:
-                async with httpx.AsyncClient() as client:
-                    for agent_name, url in self.services.items():
-                        try:
-                            # Health check
-                            response = await client.get(f"{url}/ready", timeout=5.0)
-                            status = "active" if response.status_code == 200 else "error"
-                            
-                            # Update agent state
-                            await self.update_agent_state(AgentState(
-                                agent_name=agent_name,
-                                status=status,
-                                last_update=datetime.now(timezone.utc),
-                                metrics={"health_check": response.status_code}
-                            ))
-                            
-                        except Exception as e:
-                            await self.update_agent_state(AgentState(
-                                agent_name=agent_name,
-                                status="error",
-                                last_update=datetime.now(timezone.utc),
-                                metrics={"error": str(e)}
-                            ))
+                # Check every agent concurrently; a failure comes back as the exception
+                responses = await asyncio.gather(
+                    *(self._monitor_client.get(f"{url}/ready") for url in self.services.values()),
+                    return_exceptions=True
+                )
+                
+                for agent_name, response in zip(self.services, responses):
+                    if isinstance(response, Exception):
+                        await self.update_agent_state(AgentState(
+                            agent_name=agent_name,
+                            status="error",
+                            last_update=datetime.now(timezone.utc),
+                            metrics={"error": str(response)}
+                        ))
+                        continue
+                    
+                    # Update agent state
+                    status = "active" if response.status_code == 200 else "error"
+                    await self.update_agent_state(AgentState(
+                        agent_name=agent_name,
+                        status=status,
+                        last_update=datetime.now(timezone.utc),
+                        metrics={"health_check": response.status_code}
+                    ))
                             
             except Exception as e:
                 logger.error("Error monitoring agents", error=str(e))
                 
             await asyncio.sleep(10)  # Check every 10 seconds
 
+class DecompressRequestMiddleware:
+    """Inflate gzip-encoded request bodies before they reach the routes"""
+    
+    def __init__(self, app):
+        self.app = app
+        
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or (b"content-encoding", b"gzip") not in scope["headers"]:
+            await self.app(scope, receive, send)
+            return
+            
+        chunks = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+            
+        try:
+            body = gzip.decompress(b"".join(chunks))
+        except (OSError, EOFError):
+            response = PlainTextResponse("Malformed gzip body", status_code=400)
+            await response(scope, receive, send)
+            return
+            
+        scope = dict(scope)
+        scope["headers"] = [
+            (name, value) for name, value in scope["headers"]
+            if name not in (b"content-encoding", b"content-length")
+        ] + [(b"content-length", str(len(body)).encode())]
+        
+        body_sent = False
+        
+        async def receive_body():
+            nonlocal body_sent
+            if body_sent:
+                return await receive()
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+            
+        await self.app(scope, receive_body, send)
+
 # Global dashboard instance
 dashboard = GuardianDashboard()
 
 # FastAPI App
-app = FastAPI(title="Guardian Command Center", version="1.0.0")
+app = FastAPI(
+    title="Guardian Command Center",
+    version="1.0.0",
+    default_response_class=ORJSONResponse
+)
 
 # CORS middleware
 app.add_middleware(
@@ -245,6 +384,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Agents gzip large telemetry bodies
+app.add_middleware(DecompressRequestMiddleware)
+
 # Static files for the dashboard UI
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
@@ -254,6 +396,11 @@ async def startup_event():
     asyncio.create_task(dashboard.monitor_agents())
     logger.info("Guardian Dashboard started")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release pooled health-check connections"""
+    await dashboard._monitor_client.aclose()
+
 @app.get("/", response_class=HTMLResponse)
 async def get_dashboard():
     """Serve the main dashboard UI"""
@@ -276,17 +423,16 @@ async def websocket_endpoint(websocket: WebSocket):
     
     try:
         # Send initial data
-        initial_data = await dashboard.get_dashboard_data()
-        await websocket.send_json({
-            "type": "initial_data",
-            "data": initial_data
-        })
+        await websocket.send_bytes(await dashboard.get_initial_frame())
         
         # Keep connection alive
         while True:
             await websocket.receive_text()
             
     except WebSocketDisconnect:
+        pass
+    finally:
+        # The receive loop is where disconnects surface; broadcasts only drop clients whose send failed
         dashboard.websocket_connections.discard(websocket)
 
 @app.post("/api/conversations")
@@ -301,30 +447,35 @@ async def add_api_call(api_call: APICall):
     await dashboard.add_api_call(api_call)
     return {"status": "success"}
 
+@app.post("/api/conversations/batch")
+async def add_conversation_batch(batch: AgentMessageBatch):
+    """Add a batch of agent conversations"""
+    for message in batch.items:
+        await dashboard.add_conversation(message)
+    return {"status": "success", "count": len(batch.items)}
+
+@app.post("/api/api-calls/batch")
+async def add_api_call_batch(batch: APICallBatch):
+    """Add a batch of API call records"""
+    for api_call in batch.items:
+        await dashboard.add_api_call(api_call)
+    return {"status": "success", "count": len(batch.items)}
+
 @app.get("/api/dashboard-data")
 async def get_dashboard_data():
     """Get current dashboard data"""
-    return await dashboard.get_dashboard_data()
+    return Response(content=await dashboard.get_dashboard_data(), media_type="application/json")
 
 @app.get("/api/correlations/{correlation_id}")
 async def get_correlation_data(correlation_id: str):
     """Get all events for a correlation ID"""
-    events = dashboard.active_correlations.get(correlation_id, [])
-    serialized_events = []
-    for event in events:
-        if hasattr(event, 'dict'):
-            event_dict = event.dict()
-            if 'timestamp' in event_dict and hasattr(event_dict['timestamp'], 'isoformat'):
-                event_dict['timestamp'] = event_dict['timestamp'].isoformat()
-            serialized_events.append(event_dict)
-        else:
-            serialized_events.append(event)
-    
-    return {
-        "correlation_id": correlation_id,
-        "events": serialized_events,
-        "count": len(events)
-    }
+    events = dashboard.get_correlation_events(correlation_id)
+    content = b"".join((
+        b'{"correlation_id":', dumps_json(correlation_id),
+        b',"events":', join_json_array(events),
+        b',"count":', str(len(events)).encode(), b"}"
+    ))
+    return Response(content=content, media_type="application/json")
 
 # Demo Scenarios
 DEMO_SCENARIOS = [
@@ -366,10 +517,13 @@ DEMO_SCENARIOS = [
     )
 ]
 
+# The scenarios are static, so their JSON is encoded once at import
+DEMO_SCENARIOS_JSON = dumps_json([scenario.dict() for scenario in DEMO_SCENARIOS])
+
 @app.get("/api/demo-scenarios")
 async def get_demo_scenarios():
     """Get available demo scenarios"""
-    return [scenario.dict() for scenario in DEMO_SCENARIOS]
+    return Response(content=DEMO_SCENARIOS_JSON, media_type="application/json")
 
 @app.post("/api/demo-scenarios/{scenario_id}/run")
 async def run_demo_scenario(scenario_id: str, background_tasks: BackgroundTasks):
@@ -385,15 +539,52 @@ async def run_demo_scenario(scenario_id: str, background_tasks: BackgroundTasks)
         "scenario_requested": scenario_id
     }
 
+async def _emit_demo_step(i: int, step: Dict[str, Any], correlation_id: str, delay: float):
+    """Emit one demo step after its scheduled delay"""
+    await asyncio.sleep(delay)
+    
+    # Generate realistic conversation
+    message = AgentMessage(
+        id=secrets.token_hex(16),
+        timestamp=datetime.now(timezone.utc),
+        from_agent=step["agent"],
+        to_agent="coordination-system",
+        message_type="demo_action",
+        content=f"Step {i+1}: {step['description']}",
+        correlation_id=correlation_id,
+        metadata={"step": i+1, "action": step["action"]}
+    )
+    
+    if step["action"] != "fraud_detection":
+        await dashboard.add_conversation(message)
+        return
+        
+    # Simulate the API call behind the fraud detection step alongside its message
+    await asyncio.gather(
+        dashboard.add_conversation(message),
+        dashboard.add_api_call(APICall(
+            id=secrets.token_hex(16),
+            timestamp=datetime.now(timezone.utc),
+            service="financial-guardian",
+            method="POST",
+            endpoint="/fraud/check",
+            request_data={"amount": 50000, "merchant": "Suspicious Store"},
+            response_data={"fraud_score": 0.95, "recommendation": "BLOCK"},
+            duration_ms=245,
+            status_code=200,
+            correlation_id=correlation_id
+        ))
+    )
+
 async def _execute_demo_scenario(scenario: DemoScenario):
     """Execute a demo scenario with realistic timing"""
-    correlation_id = str(uuid.uuid4())
+    correlation_id = secrets.token_hex(16)
     
     logger.info("Starting demo scenario", scenario=scenario.name, correlation_id=correlation_id)
     
     # Add scenario start message
     await dashboard.add_conversation(AgentMessage(
-        id=str(uuid.uuid4()),
+        id=secrets.token_hex(16),
         timestamp=datetime.now(timezone.utc),
         from_agent="demo-system",
         to_agent="all-agents",
@@ -403,43 +594,16 @@ async def _execute_demo_scenario(scenario: DemoScenario):
         metadata={"scenario_id": scenario.id}
     ))
     
-    # Execute each step with realistic delays
-    for i, step in enumerate(scenario.steps):
-        await asyncio.sleep(2)  # 2 second delay between steps
-        
-        # Generate realistic conversation
-        message_content = f"Step {i+1}: {step['description']}"
-        
-        await dashboard.add_conversation(AgentMessage(
-            id=str(uuid.uuid4()),
-            timestamp=datetime.now(timezone.utc),
-            from_agent=step["agent"],
-            to_agent="coordination-system",
-            message_type="demo_action",
-            content=message_content,
-            correlation_id=correlation_id,
-            metadata={"step": i+1, "action": step["action"]}
-        ))
-        
-        # Simulate API calls for realistic steps
-        if step["action"] == "fraud_detection":
-            await dashboard.add_api_call(APICall(
-                id=str(uuid.uuid4()),
-                timestamp=datetime.now(timezone.utc),
-                service="financial-guardian",
-                method="POST",
-                endpoint="/fraud/check",
-                request_data={"amount": 50000, "merchant": "Suspicious Store"},
-                response_data={"fraud_score": 0.95, "recommendation": "BLOCK"},
-                duration_ms=245,
-                status_code=200,
-                correlation_id=correlation_id
-            ))
+    # Schedule every step at its own offset (2s apart) instead of awaiting them in turn
+    await asyncio.gather(*(
+        _emit_demo_step(i, step, correlation_id, delay=(i + 1) * 2)
+        for i, step in enumerate(scenario.steps)
+    ))
     
     # Scenario completion
     await asyncio.sleep(1)
     await dashboard.add_conversation(AgentMessage(
-        id=str(uuid.uuid4()),
+        id=secrets.token_hex(16),
         timestamp=datetime.now(timezone.utc),
         from_agent="demo-system",
         to_agent="all-agents",
@@ -463,7 +627,7 @@ async def proxy_financial_guardian_fraud_check(request: Request):
         body = await request.json()
         async with httpx.AsyncClient() as client:
             response = await client.post(
-                "http://financial-guardian:8081/fraud/check",
+                "http://financial-guardian:8081/fraud/check?wait=1",
                 json=body,
                 timeout=30.0
             )
@@ -566,4 +730,5 @@ async def proxy_explainer_agent_event(request: Request):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8080)
+    # uvloop and httptools replace the pure-Python event loop and HTTP parser
+    uvicorn.run(app, host="0.0.0.0", port=8080, loop="uvloop", http="httptools", ws="websockets")
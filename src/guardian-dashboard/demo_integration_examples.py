@@ -5,290 +5,398 @@ Demo Integration Examples - Show how to integrate existing agents with the dashb
 """
 
 import asyncio
-import uuid
+import os
+import random
+import secrets
+import sys
+import orjson
 from dashboard_client import dashboard_client, log_conversation, log_coordination_event, log_fraud_detection, log_scaling_event
 
-async def demo_financial_guardian_integration():
+# Multiplier for the pauses that space out demo steps on the dashboard; 0 skips them
+DEMO_PACE = float(os.getenv("GUARDIAN_DEMO_PACE", "1.0"))
+
+async def pace(seconds: float = 1):
+    """Pause between demo steps, scaled by GUARDIAN_DEMO_PACE"""
+    if DEMO_PACE:
+        await asyncio.sleep(seconds * DEMO_PACE)
+
+# Share of routine conversation steps to emit (and pace); critical outcomes always go out
+DEMO_SAMPLE = float(os.getenv("GUARDIAN_DEMO_SAMPLE", "1.0"))
+UNSAMPLED_PREFIXES = ("🚨", "✅")
+
+def sampled(message: str) -> bool:
+    """Whether a conversation step runs, given GUARDIAN_DEMO_SAMPLE"""
+    return (DEMO_SAMPLE >= 1.0 or message.startswith(UNSAMPLED_PREFIXES)
+            or random.random() < DEMO_SAMPLE)
+
+def new_correlation_id() -> str:
+    """Fresh correlation id for one demo run"""
+    return secrets.token_hex(16)
+
+# The API monitoring calls are unrelated to each other, so each keeps a fixed id
+CID_FRAUD = new_correlation_id()
+CID_METRICS = new_correlation_id()
+CID_EXPLAIN = new_correlation_id()
+
+# API monitoring payloads never change, so they are encoded once at import
+FRAUD_CHECK_REQUEST = orjson.dumps({
+    "user_id": "testuser",
+    "amount": 50000,
+    "merchant": "Suspicious Store",
+    "location": "Unknown"
+})
+FRAUD_CHECK_RESPONSE = orjson.dumps({
+    "fraud_score": 0.95,
+    "risk_level": "CRITICAL",
+    "recommendation": "BLOCK",
+    "explanation": "Large amount + suspicious merchant name"
+})
+METRICS_RESPONSE = orjson.dumps({
+    "frontend": {"cpu": 85, "memory": 70, "replicas": 2},
+    "transaction-history": {"cpu": 45, "memory": 60, "replicas": 1}
+})
+EXPLAIN_REQUEST = orjson.dumps({
+    "scenario_type": "fraud_coordination",
+    "agents": ["financial-guardian", "ops-guardian"],
+    "correlation_id": "corr_123"
+})
+EXPLAIN_RESPONSE = orjson.dumps({
+    "explanation": "Financial Guardian detected fraud and coordinated with Ops Guardian to maintain system security",
+    "audience": "user",
+    "confidence": 0.95
+})
+
+# Demo messages are fixed, so each is interned once and shared by every run
+_MSG_FRAUD_STEP1 = sys.intern("🔍 Analyzing suspicious transaction: $50,000 to 'Suspicious Store'")
+_MSG_FRAUD_STEP2 = sys.intern("🧠 Gemini AI analysis complete: High fraud probability detected")
+_MSG_FRAUD_STEP3 = sys.intern("Requesting ops coordination for fraud investigation")
+_MSG_OPS_STEP1 = sys.intern("📊 High CPU detected: frontend service at 85% utilization")
+_MSG_OPS_STEP2 = sys.intern("🧠 Gemini AI predicts: Lunch rush pattern detected, recommend proactive scaling")
+_MSG_OPS_SCALE_REASON = sys.intern("Proactive scaling for predicted traffic surge")
+_MSG_OPS_STEP4 = sys.intern("Notifying other agents of scaling operation")
+_MSG_EXPLAIN_STEP1 = sys.intern("🔗 Correlating events from multiple agents for comprehensive explanation")
+_MSG_EXPLAIN_STEP2 = sys.intern("🌟 Enriching explanation with Bank of Anthos transaction context")
+_MSG_EXPLAIN_STEP3 = sys.intern("👤 Generated user-friendly explanation: 'Your transaction was blocked for security. No action needed.'")
+_MSG_EXPLAIN_STEP4 = sys.intern("👨‍💻 Generated operator explanation: 'Multi-agent coordination successful: Fraud blocked, scaling paused, user notified'")
+_MSG_COORD_ALERT = sys.intern("🚨 CRITICAL: Coordinated fraud attack detected across multiple accounts")
+_MSG_COORD_PAUSE = sys.intern("⏸️ Received fraud alert: Pausing all auto-scaling operations to preserve investigation resources")
+_MSG_COORD_PRIORITY = sys.intern("📢 Multi-agent coordination in progress: Fraud investigation has priority over performance optimization")
+_MSG_COORD_RESOLVED = sys.intern("✅ Fraud investigation complete: 12 transactions blocked, attack neutralized")
+_MSG_COORD_RESUME = sys.intern("▶️ Resuming normal auto-scaling operations: Investigation resources released")
+_MSG_COORD_REPORT = sys.intern("📋 Final report: Multi-agent coordination successful. System security maintained, performance optimized.")
+
+async def demo_financial_guardian_integration(parent_trace_id: str = None):
     """Example of how Financial Guardian would integrate with dashboard"""
     
-    # Set agent name
-    dashboard_client.set_agent_name("financial-guardian")
-    
     # Simulate fraud detection workflow
-    correlation_id = str(uuid.uuid4())
+    correlation_id = new_correlation_id()
     
     # Step 1: Fraud detection
-    await log_conversation(
-        "🔍 Analyzing suspicious transaction: $50,000 to 'Suspicious Store'",
-        to_agent="system",
-        correlation_id=correlation_id
-    )
-    
-    await asyncio.sleep(1)
+    # Each step's pacing delay runs alongside its emission rather than after it
+    if sampled(_MSG_FRAUD_STEP1):
+        await asyncio.gather(
+            log_conversation(
+                _MSG_FRAUD_STEP1,
+                to_agent="system",
+                correlation_id=correlation_id,
+                agent_name="financial-guardian",
+                parent_trace_id=parent_trace_id
+            ),
+            pace(1)
+        )
     
     # Step 2: AI analysis
-    await log_conversation(
-        "🧠 Gemini AI analysis complete: High fraud probability detected",
-        to_agent="system", 
-        correlation_id=correlation_id
-    )
-    
-    await asyncio.sleep(1)
+    if sampled(_MSG_FRAUD_STEP2):
+        await asyncio.gather(
+            log_conversation(
+                _MSG_FRAUD_STEP2,
+                to_agent="system", 
+                correlation_id=correlation_id,
+                agent_name="financial-guardian",
+                parent_trace_id=parent_trace_id
+            ),
+            pace(1)
+        )
     
     # Step 3: Coordination request
-    await log_coordination_event(
-        "Requesting ops coordination for fraud investigation",
-        correlation_id=correlation_id,
-        agents=["ops-guardian", "explainer-agent"]
+    await asyncio.gather(
+        log_coordination_event(
+            _MSG_FRAUD_STEP3,
+            correlation_id=correlation_id,
+            agents=["ops-guardian", "explainer-agent"],
+            agent_name="financial-guardian",
+            parent_trace_id=parent_trace_id
+        ),
+        pace(1)
     )
     
-    await asyncio.sleep(1)
-    
     # Step 4: Fraud detection result
     await log_fraud_detection(
         transaction_id="tx_123456",
         fraud_score=0.95,
         action="BLOCKED",
-        correlation_id=correlation_id
+        correlation_id=correlation_id,
+        agent_name="financial-guardian",
+        parent_trace_id=parent_trace_id
     )
 
-async def demo_ops_guardian_integration():
+async def demo_ops_guardian_integration(parent_trace_id: str = None):
     """Example of how Ops Guardian would integrate with dashboard"""
     
-    # Set agent name
-    dashboard_client.set_agent_name("ops-guardian")
-    
     # Simulate scaling workflow
-    correlation_id = str(uuid.uuid4())
+    correlation_id = new_correlation_id()
     
     # Step 1: Metrics analysis
-    await log_conversation(
-        "📊 High CPU detected: frontend service at 85% utilization",
-        to_agent="system",
-        correlation_id=correlation_id
-    )
-    
-    await asyncio.sleep(1)
+    if sampled(_MSG_OPS_STEP1):
+        await asyncio.gather(
+            log_conversation(
+                _MSG_OPS_STEP1,
+                to_agent="system",
+                correlation_id=correlation_id,
+                agent_name="ops-guardian",
+                parent_trace_id=parent_trace_id
+            ),
+            pace(1)
+        )
     
     # Step 2: AI prediction
-    await log_conversation(
-        "🧠 Gemini AI predicts: Lunch rush pattern detected, recommend proactive scaling",
-        to_agent="system",
-        correlation_id=correlation_id
-    )
-    
-    await asyncio.sleep(1)
-    
-    # Step 3: Scaling decision
-    await log_scaling_event(
-        service="frontend",
-        old_replicas=2,
-        new_replicas=4,
-        reason="Proactive scaling for predicted traffic surge",
-        correlation_id=correlation_id
-    )
-    
-    await asyncio.sleep(1)
-    
-    # Step 4: Coordination with other agents
-    await log_coordination_event(
-        "Notifying other agents of scaling operation",
-        correlation_id=correlation_id,
-        agents=["financial-guardian", "explainer-agent"]
+    if sampled(_MSG_OPS_STEP2):
+        await asyncio.gather(
+            log_conversation(
+                _MSG_OPS_STEP2,
+                to_agent="system",
+                correlation_id=correlation_id,
+                agent_name="ops-guardian",
+                parent_trace_id=parent_trace_id
+            ),
+            pace(1)
+        )
+    
+    # Steps 3 and 4: the scaling decision and the notice to the other agents
+    # don't depend on each other, so they go out together
+    await asyncio.gather(
+        log_scaling_event(
+            service="frontend",
+            old_replicas=2,
+            new_replicas=4,
+            reason=_MSG_OPS_SCALE_REASON,
+            correlation_id=correlation_id,
+            agent_name="ops-guardian",
+            parent_trace_id=parent_trace_id
+        ),
+        log_coordination_event(
+            _MSG_OPS_STEP4,
+            correlation_id=correlation_id,
+            agents=["financial-guardian", "explainer-agent"],
+            agent_name="ops-guardian",
+            parent_trace_id=parent_trace_id
+        )
     )
 
-async def demo_explainer_agent_integration():
+async def demo_explainer_agent_integration(parent_trace_id: str = None):
     """Example of how Explainer Agent would integrate with dashboard"""
     
-    # Set agent name
-    dashboard_client.set_agent_name("explainer-agent")
-    
     # Simulate explanation generation
-    correlation_id = str(uuid.uuid4())
+    correlation_id = new_correlation_id()
     
     # Step 1: Event correlation
-    await log_conversation(
-        "🔗 Correlating events from multiple agents for comprehensive explanation",
-        to_agent="system",
-        correlation_id=correlation_id
-    )
-    
-    await asyncio.sleep(1)
+    if sampled(_MSG_EXPLAIN_STEP1):
+        await asyncio.gather(
+            log_conversation(
+                _MSG_EXPLAIN_STEP1,
+                to_agent="system",
+                correlation_id=correlation_id,
+                agent_name="explainer-agent",
+                parent_trace_id=parent_trace_id
+            ),
+            pace(1)
+        )
     
     # Step 2: Context enrichment
-    await log_conversation(
-        "🌟 Enriching explanation with Bank of Anthos transaction context",
-        to_agent="system",
-        correlation_id=correlation_id
-    )
-    
-    await asyncio.sleep(1)
-    
-    # Step 3: User explanation generated
-    await log_conversation(
-        "👤 Generated user-friendly explanation: 'Your transaction was blocked for security. No action needed.'",
-        to_agent="user-interface",
-        correlation_id=correlation_id
-    )
-    
-    await asyncio.sleep(1)
-    
-    # Step 4: Operator explanation
-    await log_conversation(
-        "👨‍💻 Generated operator explanation: 'Multi-agent coordination successful: Fraud blocked, scaling paused, user notified'",
-        to_agent="operations-team",
-        correlation_id=correlation_id
-    )
+    if sampled(_MSG_EXPLAIN_STEP2):
+        await asyncio.gather(
+            log_conversation(
+                _MSG_EXPLAIN_STEP2,
+                to_agent="system",
+                correlation_id=correlation_id,
+                agent_name="explainer-agent",
+                parent_trace_id=parent_trace_id
+            ),
+            pace(1)
+        )
+    
+    # Steps 3 and 4: the user and operator explanations go to different
+    # audiences and don't depend on each other, so they go out together
+    explanations = []
+    if sampled(_MSG_EXPLAIN_STEP3):
+        explanations.append(log_conversation(
+            _MSG_EXPLAIN_STEP3,
+            to_agent="user-interface",
+            correlation_id=correlation_id,
+            agent_name="explainer-agent",
+            parent_trace_id=parent_trace_id
+        ))
+    if sampled(_MSG_EXPLAIN_STEP4):
+        explanations.append(log_conversation(
+            _MSG_EXPLAIN_STEP4,
+            to_agent="operations-team",
+            correlation_id=correlation_id,
+            agent_name="explainer-agent",
+            parent_trace_id=parent_trace_id
+        ))
+    await asyncio.gather(*explanations)
 
-async def demo_multi_agent_coordination():
+async def demo_multi_agent_coordination(parent_trace_id: str = None):
     """Demonstrate complex multi-agent coordination scenario"""
     
-    correlation_id = str(uuid.uuid4())
+    correlation_id = new_correlation_id()
     
     # Financial Guardian starts
-    dashboard_client.set_agent_name("financial-guardian")
-    await log_conversation(
-        "🚨 CRITICAL: Coordinated fraud attack detected across multiple accounts",
-        to_agent="coordination-system",
-        correlation_id=correlation_id
-    )
-    
-    await asyncio.sleep(1)
+    if sampled(_MSG_COORD_ALERT):
+        await asyncio.gather(
+            log_conversation(
+                _MSG_COORD_ALERT,
+                to_agent="coordination-system",
+                correlation_id=correlation_id,
+                agent_name="financial-guardian",
+                parent_trace_id=parent_trace_id
+            ),
+            pace(1)
+        )
     
     # Ops Guardian responds
-    dashboard_client.set_agent_name("ops-guardian")
-    await log_conversation(
-        "⏸️ Received fraud alert: Pausing all auto-scaling operations to preserve investigation resources",
-        to_agent="financial-guardian",
-        correlation_id=correlation_id
-    )
-    
-    await asyncio.sleep(1)
+    if sampled(_MSG_COORD_PAUSE):
+        await asyncio.gather(
+            log_conversation(
+                _MSG_COORD_PAUSE,
+                to_agent="financial-guardian",
+                correlation_id=correlation_id,
+                agent_name="ops-guardian",
+                parent_trace_id=parent_trace_id
+            ),
+            pace(1)
+        )
     
     # Explainer Agent coordinates
-    dashboard_client.set_agent_name("explainer-agent")
-    await log_conversation(
-        "📢 Multi-agent coordination in progress: Fraud investigation has priority over performance optimization",
-        to_agent="all-systems",
-        correlation_id=correlation_id
-    )
-    
-    await asyncio.sleep(2)
+    if sampled(_MSG_COORD_PRIORITY):
+        await asyncio.gather(
+            log_conversation(
+                _MSG_COORD_PRIORITY,
+                to_agent="all-systems",
+                correlation_id=correlation_id,
+                agent_name="explainer-agent",
+                parent_trace_id=parent_trace_id
+            ),
+            pace(2)
+        )
     
     # Resolution
-    dashboard_client.set_agent_name("financial-guardian")
-    await log_conversation(
-        "✅ Fraud investigation complete: 12 transactions blocked, attack neutralized",
-        to_agent="coordination-system",
-        correlation_id=correlation_id
-    )
-    
-    await asyncio.sleep(1)
-    
-    dashboard_client.set_agent_name("ops-guardian")
-    await log_conversation(
-        "▶️ Resuming normal auto-scaling operations: Investigation resources released",
-        to_agent="financial-guardian",
-        correlation_id=correlation_id
-    )
-    
-    await asyncio.sleep(1)
-    
-    dashboard_client.set_agent_name("explainer-agent")
-    await log_conversation(
-        "📋 Final report: Multi-agent coordination successful. System security maintained, performance optimized.",
-        to_agent="management-dashboard",
-        correlation_id=correlation_id
-    )
+    if sampled(_MSG_COORD_RESOLVED):
+        await asyncio.gather(
+            log_conversation(
+                _MSG_COORD_RESOLVED,
+                to_agent="coordination-system",
+                correlation_id=correlation_id,
+                agent_name="financial-guardian",
+                parent_trace_id=parent_trace_id
+            ),
+            pace(1)
+        )
+    
+    if sampled(_MSG_COORD_RESUME):
+        await asyncio.gather(
+            log_conversation(
+                _MSG_COORD_RESUME,
+                to_agent="financial-guardian",
+                correlation_id=correlation_id,
+                agent_name="ops-guardian",
+                parent_trace_id=parent_trace_id
+            ),
+            pace(1)
+        )
+    
+    if sampled(_MSG_COORD_REPORT):
+        await log_conversation(
+            _MSG_COORD_REPORT,
+            to_agent="management-dashboard",
+            correlation_id=correlation_id,
+            agent_name="explainer-agent",
+            parent_trace_id=parent_trace_id
+        )
 
-async def demo_api_monitoring():
+async def demo_api_monitoring(parent_trace_id: str = None):
     """Demonstrate API call monitoring"""
     
-    dashboard_client.set_agent_name("financial-guardian")
-    
-    # Simulate API calls with realistic data
-    await dashboard_client.send_api_call(
-        method="POST",
-        endpoint="/fraud/check",
-        request_data={
-            "user_id": "testuser",
-            "amount": 50000,
-            "merchant": "Suspicious Store",
-            "location": "Unknown"
-        },
-        response_data={
-            "fraud_score": 0.95,
-            "risk_level": "CRITICAL",
-            "recommendation": "BLOCK",
-            "explanation": "Large amount + suspicious merchant name"
-        },
-        duration_ms=245,
-        status_code=200,
-        correlation_id=str(uuid.uuid4())
-    )
-    
-    await asyncio.sleep(1)
-    
-    dashboard_client.set_agent_name("ops-guardian")
-    
-    await dashboard_client.send_api_call(
-        method="GET",
-        endpoint="/metrics",
-        request_data={},
-        response_data={
-            "frontend": {"cpu": 85, "memory": 70, "replicas": 2},
-            "transaction-history": {"cpu": 45, "memory": 60, "replicas": 1}
-        },
-        duration_ms=120,
-        status_code=200,
-        correlation_id=str(uuid.uuid4())
-    )
-    
-    await asyncio.sleep(1)
-    
-    dashboard_client.set_agent_name("explainer-agent")
-    
-    await dashboard_client.send_api_call(
-        method="POST",
-        endpoint="/explain/multi-agent-scenario",
-        request_data={
-            "scenario_type": "fraud_coordination",
-            "agents": ["financial-guardian", "ops-guardian"],
-            "correlation_id": "corr_123"
-        },
-        response_data={
-            "explanation": "Financial Guardian detected fraud and coordinated with Ops Guardian to maintain system security",
-            "audience": "user",
-            "confidence": 0.95
-        },
-        duration_ms=890,
-        status_code=200,
-        correlation_id=str(uuid.uuid4())
+    # Simulate API calls with realistic data; the three calls are unrelated,
+    # so each keeps its own correlation id and all are issued at once
+    await asyncio.gather(
+        dashboard_client.send_api_call(
+            method="POST",
+            endpoint="/fraud/check",
+            request_data=None,
+            response_data=None,
+            request_json=FRAUD_CHECK_REQUEST,
+            response_json=FRAUD_CHECK_RESPONSE,
+            duration_ms=245,
+            status_code=200,
+            correlation_id=CID_FRAUD,
+            agent_name="financial-guardian",
+            parent_trace_id=parent_trace_id
+        ),
+        dashboard_client.send_api_call(
+            method="GET",
+            endpoint="/metrics",
+            request_data={},
+            response_data=None,
+            response_json=METRICS_RESPONSE,
+            duration_ms=120,
+            status_code=200,
+            correlation_id=CID_METRICS,
+            agent_name="ops-guardian",
+            parent_trace_id=parent_trace_id
+        ),
+        dashboard_client.send_api_call(
+            method="POST",
+            endpoint="/explain/multi-agent-scenario",
+            request_data=None,
+            response_data=None,
+            request_json=EXPLAIN_REQUEST,
+            response_json=EXPLAIN_RESPONSE,
+            duration_ms=890,
+            status_code=200,
+            correlation_id=CID_EXPLAIN,
+            agent_name="explainer-agent",
+            parent_trace_id=parent_trace_id
+        )
     )
 
 async def run_all_demos():
     """Run all demo scenarios"""
     print("🎬 Starting Guardian Dashboard Demo...")
     
-    # Run individual agent demos
-    await demo_financial_guardian_integration()
-    await asyncio.sleep(2)
-    
-    await demo_ops_guardian_integration()
-    await asyncio.sleep(2)
-    
-    await demo_explainer_agent_integration()
-    await asyncio.sleep(2)
-    
-    # Run complex coordination demo
-    await demo_multi_agent_coordination()
-    await asyncio.sleep(2)
-    
-    # Run API monitoring demo
-    await demo_api_monitoring()
+    # One pooled connection and one background batcher serve every demo;
+    # leaving the block posts whatever is still queued and closes them
+    async with dashboard_client:
+        # The demos are independent flows, so they run side by side under one
+        # root trace; each event carries it as parent_trace_id next to its correlation_id
+        root_trace = secrets.token_hex(16)
+        await asyncio.gather(
+            demo_financial_guardian_integration(root_trace),
+            demo_ops_guardian_integration(root_trace),
+            demo_explainer_agent_integration(root_trace),
+            demo_multi_agent_coordination(root_trace),
+            demo_api_monitoring(root_trace)
+        )
     
     print("✅ All demos completed!")
 
 if __name__ == "__main__":
-    # Run the demos
-    asyncio.run(run_all_demos())
+    # Run the demos on uvloop when it is installed, else on the default loop
+    try:
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+    
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(run_all_demos())
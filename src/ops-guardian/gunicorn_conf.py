@@ -0,0 +1,25 @@
+"""
+Gunicorn configuration for the Ops Guardian service
+
+The informer cache, metrics history and monitoring thread live in process
+memory, so the service runs as a single worker and gets its concurrency from
+threads: a /metrics scrape or coordination callback never waits behind a slow
+call to the Explainer or Financial Guardian.
+"""
+
+import os
+
+bind = f":{os.getenv('PORT', '8083')}"
+
+workers = 1
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', '16'))
+
+# Reuse connections from the coordinator and probes; fail requests stuck past the Gemini timeout
+keepalive = 30
+timeout = 60
+graceful_timeout = 10
+
+loglevel = os.getenv('LOG_LEVEL', 'info').lower()
+accesslog = None
+errorlog = '-'